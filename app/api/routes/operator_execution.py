@@ -1,5 +1,8 @@
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import orjson
 from datetime import datetime
 
 from app.schemas.requests import (
@@ -15,6 +18,7 @@ from app.schemas.responses import (
 from app.services.operator_runner import (
     OperatorRunnerInterface,
     create_operator_runner,
+    OperatorCaseResult,
     StepExecutionResult
 )
 from app.api.dependencies import (
@@ -73,16 +77,7 @@ async def execute_operator_case(
             tenant_id=tenant_id,
             execution_time=datetime.now(),
             success=result.success,
-            steps_results=[
-                {
-                    "step": step_result.natural_language_step,
-                    "success": step_result.execution_result.success,
-                    "screenshot_url": step_result.execution_result.screenshot_path,
-                    "duration": step_result.duration,
-                    "error": step_result.execution_result.error_message
-                }
-                for step_result in result.steps_results
-            ],
+            steps_results=[step_summary(step_result) for step_result in result.steps_results],
             total_duration=result.total_duration,
             error_message=result.error_message
         )
@@ -94,6 +89,49 @@ async def execute_operator_case(
             detail=f"Test execution failed: {str(e)}"
         )
 
+@router.post(
+    "/execute/stream",
+    summary="Execute a single test case, streaming step results",
+    description="Execute a test case and stream one NDJSON line per step as it completes, followed by the case result"
+)
+async def stream_operator_case(
+    request: TestCaseRequest,
+    test_runner: OperatorRunnerInterface = Depends(get_operator_runner),
+    tenant_id: str = Depends(get_current_tenant),
+) -> StreamingResponse:
+    """
+    Execute a single test case, sending each step result as soon as it completes.
+
+    Lines carry "type": "step" with the same fields as TestCaseResponse.steps_results,
+    and the final line "type": "result" with the case outcome.
+    """
+    async def lines() -> AsyncIterator[bytes]:
+        try:
+            async for item in test_runner.stream_operator_case(
+                url=request.url,
+                natural_language_steps=request.test_steps,
+                headless=request.headless if request.headless is not None else False
+            ):
+                if isinstance(item, OperatorCaseResult):
+                    line = {
+                        "type": "result",
+                        "request_id": item.metadata.get("request_id"),
+                        "tenant_id": tenant_id,
+                        "execution_time": datetime.now(),
+                        "success": item.success,
+                        "total_duration": item.total_duration,
+                        "error_message": item.error_message
+                    }
+                else:
+                    line = {"type": "step", **step_summary(item)}
+                yield orjson.dumps(line) + b"\n"
+        except Exception as e:
+            # Headers are already sent, so the failure is reported in-band
+            logger.error(f"Streamed test execution failed: {str(e)}", exc_info=True)
+            yield orjson.dumps({"type": "error", "error_message": f"Test execution failed: {str(e)}"}) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @router.post(
     "/execute/file",
     response_model=TestCaseResponse,
@@ -176,14 +214,30 @@ async def execute_operator_suite(
         start_time = datetime.now()
         suite_results = []
 
-        for test_case in request.test_cases:
-            result = await execute_operator_case(
-                test_case,
-                background_tasks,
-                test_runner,
-                tenant_id
-            )
-            suite_results.append(result)
+        if request.parallel_execution:
+            # Each case gets its own runner; their sessions share one launched browser,
+            # each in a separate context
+            semaphore = asyncio.Semaphore(request.max_parallel_tests or 1)
+
+            async def run_case(test_case: TestCaseRequest) -> TestCaseResponse:
+                async with semaphore:
+                    return await execute_operator_case(
+                        test_case,
+                        background_tasks,
+                        get_operator_runner(),
+                        tenant_id
+                    )
+
+            suite_results = list(await asyncio.gather(*(run_case(tc) for tc in request.test_cases)))
+        else:
+            for test_case in request.test_cases:
+                result = await execute_operator_case(
+                    test_case,
+                    background_tasks,
+                    test_runner,
+                    tenant_id
+                )
+                suite_results.append(result)
 
         end_time = datetime.now()
         total_duration = (end_time - start_time).total_seconds()
@@ -207,6 +261,16 @@ async def execute_operator_suite(
         )
 
 # Helper functions
+def step_summary(step_result: StepExecutionResult) -> Dict[str, Any]:
+    """Client-facing fields of a step result."""
+    return {
+        "step": step_result.natural_language_step,
+        "success": step_result.execution_result.success,
+        "screenshot_url": step_result.execution_result.screenshot_path,
+        "duration": step_result.duration,
+        "error": step_result.execution_result.error_message
+    }
+
 async def cleanup_operator_artifacts(step_results: List[StepExecutionResult]) -> None:
     """Clean up screenshots and other artifacts after test execution."""
     try:
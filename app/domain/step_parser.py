@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Pattern, Tuple
 import re
 from datetime import datetime, UTC
 
@@ -33,6 +33,14 @@ class ParsedStep:
         if not isinstance(self.step_type, StepType):
             raise ValueError(f"Invalid step type: {self.step_type}")
 
+def _compile_patterns(patterns: Dict[str, str]) -> Tuple[Tuple[StepType, Pattern], ...]:
+    """Compile step patterns once, in StepType order, so parsing skips the re module cache."""
+    return tuple(
+        (step_type, re.compile(patterns[step_type.value]))
+        for step_type in StepType
+        if step_type.value in patterns
+    )
+
 class StepParser(ABC):
     """Abstract base class for step parsers."""
 
@@ -69,17 +77,18 @@ class GherkinStepParser(StepParser):
         # Verify pattern matches "see/verify/check the <target>"
         "verify": r"(?:see|verify|check|confirm)(?:\s+that)?(?:\s+the)?\s+(.+?)(?:\s+is\s+displayed|\s+appears)?$"
     }
+    _COMPILED_PATTERNS = _compile_patterns(PATTERNS)
 
     def parse_steps(self, steps_text: str) -> List[ParsedStep]:
         """Parse multiple steps from text."""
         if not steps_text or not steps_text.strip():
             return []
 
-        # Split text into lines and filter out empty lines and comments
+        # Split text into lines and filter out empty lines and comments, stripping each line once
         lines = [
-            line.strip()
+            stripped
             for line in steps_text.split('\n')
-            if line.strip() and not line.strip().startswith('#')
+            if (stripped := line.strip()) and not stripped.startswith('#')
         ]
 
         return [self.parse_single_step(step) for step in lines]
@@ -98,12 +107,9 @@ class GherkinStepParser(StepParser):
             raise InvalidStepFormatException("Step is empty or whitespace only.")
 
         # Try each pattern to find matching step type
-        for step_type in StepType:
-            pattern = self.PATTERNS.get(step_type.value)
-            if not pattern:
-                continue
-
-            match = re.search(pattern, step_text.lower())
+        lowered = step_text.lower()
+        for step_type, pattern in self._COMPILED_PATTERNS:
+            match = pattern.search(lowered)
             if match:
                 return self._create_parsed_step(
                     step_type=step_type,
@@ -48,7 +48,7 @@ class AbacusAIClient(AIClientInterface):
             logger.error(f"Failed to initialize Abacus.AI SDK client: {str(e)}")
             raise AIClientException(f"SDK initialization failed: {str(e)}")
 
-    async def send_prompt(self, prompt: str) -> AIResponse:
+    async def send_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
         """Send a prompt using the Abacus.AI SDK."""
         try:
             logger.debug(f"Sending prompt to Abacus.AI (model: {self._model_name})")
@@ -56,6 +56,7 @@ class AbacusAIClient(AIClientInterface):
             # Call evaluatePrompt using the SDK
             response = self._sdk_client.evaluate_prompt(
                 prompt=prompt,
+                system_message=system_prompt,
                 llm_name=self._model_name,
                 max_tokens=self._max_tokens,
                 temperature=self._temperature
@@ -154,16 +155,18 @@ class GeminiAIClient(AIClientInterface):
         self._max_tokens = max_tokens
         self._temperature = temperature
         self._base_url = "https://generativelanguage.googleapis.com/v1beta/models/{}:generateContent".format(self._model_name) # Use dynamic url
+        self._session = requests.Session()  # keeps the TLS connection alive across prompts
 
         logger.info(f"Successfully initialized Gemini API client with model: {self._model_name}")
 
 
-    async def send_prompt(self, prompt: str) -> AIResponse:
+    async def send_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
         """
         Sends a prompt to the Gemini API and retrieves the response.
 
         Args:
             prompt: The prompt to send to the API.
+            system_prompt: Static instructions sent as the system instruction.
 
         Returns:
             An AIResponse object containing the generated text.
@@ -208,10 +211,12 @@ class GeminiAIClient(AIClientInterface):
                 "temperature": self._temperature
             },
         }
+        if system_prompt:
+            payload["systemInstruction"] = {"parts": [{"text": system_prompt}]}
 
         logger.debug(f"Sending prompt to Gemini API: {self._base_url}")
         try:
-            response = requests.post(self._base_url, headers=headers, json=payload)
+            response = self._session.post(self._base_url, headers=headers, json=payload)
             response.raise_for_status()  # Raise for bad status codes
             data = response.json()
             #logger.debug(f"Received response from Gemini API: {data}")
@@ -330,15 +335,17 @@ class GrokAIClient(AIClientInterface):
         self._max_tokens = max_tokens
         self._temperature = temperature
         self._base_url = "https://api.x.ai/v1/chat/completions"
+        self._session = requests.Session()  # keeps the TLS connection alive across prompts
 
         logger.info(f"Successfully initialized Grok API client with model: {self._model_name}")
 
-    async def send_prompt(self, prompt: str) -> AIResponse:
+    async def send_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
         """
         Sends a prompt to the xAI Grok API and retrieves the response.
 
         Args:
             prompt: The prompt to send to the API.
+            system_prompt: Static instructions sent as the system message.
 
         Returns:
             An AIResponse object containing the generated text.
@@ -354,7 +361,7 @@ class GrokAIClient(AIClientInterface):
             "messages": [
                 {
                     "role": "system",
-                    "content": "You are a test assistant."
+                    "content": system_prompt or "You are a test assistant."
                 },
                 {
                     "role": "user",
@@ -369,7 +376,7 @@ class GrokAIClient(AIClientInterface):
 
         logger.debug(f"Sending prompt to Grok API: {self._base_url}")
         try:
-            response = requests.post(self._base_url, headers=headers, json=payload)
+            response = self._session.post(self._base_url, headers=headers, json=payload)
             response.raise_for_status()  # Raise for bad status codes
             data = response.json()
             #logger.debug(f"Received response from Grok API: {data}")
@@ -503,15 +510,17 @@ You should:
         self._max_tokens = max_tokens
         self._temperature = temperature
         self._base_url = "https://api.openai.com/v1/chat/completions"
+        self._session = requests.Session()  # keeps the TLS connection alive across prompts
 
         logger.info(f"Successfully initialized OpenAI client with model: {self._model_name}")
 
-    async def send_prompt(self, prompt: str) -> AIResponse:
+    async def send_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
         """
         Sends a prompt to the OpenAI API and retrieves the response.
 
         Args:
             prompt: The prompt to send to the API.
+            system_prompt: Static instructions sent as the system message.
 
         Returns:
             An AIResponse object containing the generated text.
@@ -528,7 +537,7 @@ You should:
             "messages": [
                 {
                     "role": "system",
-                    "content": self.SYSTEM_PROMPT
+                    "content": system_prompt or self.SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
@@ -541,7 +550,7 @@ You should:
 
         logger.debug(f"Sending prompt to OpenAI API: {self._base_url}")
         try:
-            response = requests.post(self._base_url, headers=headers, json=payload)
+            response = self._session.post(self._base_url, headers=headers, json=payload)
             response.raise_for_status()
             data = response.json()
             #logger.debug(f"Received response from OpenAI API: {data}")
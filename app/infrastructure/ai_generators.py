@@ -1,9 +1,14 @@
 # app/infrastructure/ai_generators.py
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+import asyncio
+import hashlib
 import json
 import os
+import sqlite3
+import threading
 from app.domain.exceptions import AIClientException
 from abc import ABC, abstractmethod
 
@@ -13,8 +18,9 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=None)
 def load_prompt(filename: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (read once per process)."""
     prompt_path = os.path.join("app", "prompts", filename)
     try:
         with open(prompt_path, "r") as f:
@@ -22,6 +28,63 @@ def load_prompt(filename: str) -> str:
     except FileNotFoundError:
         raise ValueError(f"Prompt file not found: {filename}")
 
+def split_prompt(template: str, marker: str = "INPUT:") -> Tuple[str, str]:
+    """Split a template into its static instructions and the per-call section starting at marker."""
+    static, found, dynamic = template.partition(marker)
+    if not found:
+        return "", template
+    return static.rstrip(), found + dynamic
+
+def cached_prompt_tokens(metadata: Optional[Dict[str, Any]]) -> Optional[int]:
+    """Return the provider-reported count of prompt tokens served from its prefix cache, if any."""
+    raw = (metadata or {}).get("raw_response") or {}
+    usage = raw.get("usage") or {}
+    if "prompt_tokens_details" in usage:  # OpenAI / xAI
+        return (usage["prompt_tokens_details"] or {}).get("cached_tokens")
+    if "cache_read_input_tokens" in usage:  # Anthropic
+        return usage["cache_read_input_tokens"]
+    return (raw.get("usageMetadata") or {}).get("cachedContentTokenCount")  # Gemini
+
+class ResponseCache:
+    """Persistent on-disk cache of validated AI responses keyed on the rendered prompt.
+
+    Calls block on disk I/O; async callers run them in a worker thread, so access to the
+    shared connection is serialized here.
+    """
+
+    def __init__(self, path: str):
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        return hashlib.blake2b(f"{model_name}\0{prompt}".encode(), digest_size=32).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content))
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
 @dataclass
 class GherkinStep:
     """Represents a structured Gherkin step with its parsed components."""
@@ -141,20 +204,44 @@ class NLToGherkinGenerator(GeneratorInterface):
 class PlaywrightGenerator(GeneratorInterface):
     """Generates Playwright instructions from Gherkin steps and HTML snapshots."""
 
-    def __init__(self, ai_client: AIClientInterface):
+    def __init__(self, ai_client: AIClientInterface, cache: Optional[ResponseCache] = None):
         self.ai_client = ai_client
-        self.prompt_template = load_prompt("gherkin_to_playwright.txt")
+        self.cache = cache
+        # Instructions and examples go out as a byte-identical system prompt so provider-side
+        # prefix caching can match; only the snapshot and step vary per call
+        self.system_prompt, self.prompt_template = split_prompt(load_prompt("gherkin_to_playwright.txt"))
+
+    def _render_prompt(self, snapshot: str, gherkin_step: str) -> str:
+        prompt = self.prompt_template.replace("{web_page_snapshot}", snapshot)
+        return prompt.replace("{gherkin_step}", gherkin_step)
+
+    def _cache_key(self, prompt: str) -> str:
+        return ResponseCache.make_key(getattr(self.ai_client, "model_name", ""), f"{self.system_prompt}\0{prompt}")
+
+    async def invalidate_instruction(self, snapshot: str, gherkin_step: str) -> None:
+        """Drop the cached instruction for this snapshot and step, e.g. after none of it executed."""
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.delete, self._cache_key(self._render_prompt(snapshot, gherkin_step)))
 
     async def generate_instruction(self, snapshot: str, gherkin_step: str) -> str:
         """Generate a Playwright instruction from a snapshot and Gherkin step."""
         try:
             # Prepare the prompt
-            prompt = self.prompt_template.replace("{web_page_snapshot}", snapshot)
-            prompt = prompt.replace("{gherkin_step}", gherkin_step)
+            prompt = self._render_prompt(snapshot, gherkin_step)
             #logger.debug(f"Prompt PlaywrightGenerator: {prompt}")
 
+            # Same step against the same snapshot yields the same prompt; reuse the earlier answer
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self._cache_key(prompt)
+                cached = await asyncio.to_thread(self.cache.get, cache_key)
+                if cached is not None:
+                    logger.debug("PlaywrightGenerator cache hit")
+                    return cached
+
             # Get response from AI
-            response = await self.ai_client.send_prompt(prompt)
+            response = await self.ai_client.send_prompt(prompt, system_prompt=self.system_prompt)
+            logger.debug(f"PlaywrightGenerator cached prompt tokens: {cached_prompt_tokens(response.metadata)}")
             #logger.debug(f"Response PlaywrightGenerator: {response}")
 
             response_content = self._clean_instruction(response.content)
@@ -163,6 +250,9 @@ class PlaywrightGenerator(GeneratorInterface):
             if not await self.validate_response(response_content):
                 raise StepGenerationException("Invalid Playwright instruction format")
 
+            if cache_key is not None:
+                await asyncio.to_thread(self.cache.set, cache_key, response_content)
+
             # Return the cleaned instruction
             return response_content
         
@@ -232,9 +322,16 @@ def create_nl_to_gherkin_generator(
     return NLToGherkinGenerator(ai_client)
 
 def create_playwright_generator(
-    ai_client_type: str = "abacus"
+    ai_client_type: str = "abacus",
+    cache_path: Optional[str] = None
 ) -> PlaywrightGenerator:
-    """Factory function to create Playwright generator."""
+    """Factory function to create Playwright generator. The response cache is only used when cache_path is given."""
     from app.infrastructure.ai_client import create_ai_client
     ai_client = create_ai_client(ai_client_type)
-    return PlaywrightGenerator(ai_client)
\ No newline at end of file
+    cache = None
+    if cache_path:
+        try:
+            cache = ResponseCache(cache_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Response cache disabled, could not open {cache_path}: {e}")
+    return PlaywrightGenerator(ai_client, cache=cache)
\ No newline at end of file
@@ -1,5 +1,6 @@
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from bs4 import BeautifulSoup, Comment, NavigableString
+import orjson
 from app.utils.config import HTML_SUMMARIZER_CONFIG
 from app.infrastructure.interfaces import HTMLSummarizerInterface
 import logging
@@ -7,6 +8,16 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)  # Set to DEBUG for detailed logging
 
+# Tag category lookup for is_visible: 1 = interactive, 2 = special (always visible), 0 = other
+_TAG_INTERACTIVE = 1
+_TAG_SPECIAL = 2
+_TAG_CAT = {
+    'a': _TAG_INTERACTIVE, 'button': _TAG_INTERACTIVE, 'input': _TAG_INTERACTIVE,
+    'select': _TAG_INTERACTIVE, 'textarea': _TAG_INTERACTIVE,
+    'img': _TAG_SPECIAL, 'svg': _TAG_SPECIAL, 'canvas': _TAG_SPECIAL, 'iframe': _TAG_SPECIAL,
+}
+_INTERACTIVE_ROLES = frozenset({'button', 'link', 'textbox', 'combobox', 'menuitem', 'tab'})
+
 class HTMLSummarizer(HTMLSummarizerInterface):
     """Converts HTML to a JSON DOM for visible and hidden elements, compatible with Playwright.
 
@@ -63,24 +74,24 @@ class HTMLSummarizer(HTMLSummarizerInterface):
             parent = parent.parent
         
         # Check if element is interactive
-        interactive = element.name in ['a', 'button', 'input', 'select', 'textarea'] or \
-                      element.get('role') in ['button', 'link', 'textbox', 'combobox', 'menuitem', 'tab']
-        if interactive:
-            text = element.get_text(strip=True)
-            if text or element.attrs or element.find_all(recursive=False):
+        category = _TAG_CAT.get(element.name, 0)
+        if category == _TAG_INTERACTIVE or element.get('role') in _INTERACTIVE_ROLES:
+            # stripped_strings is lazy: stop at the first non-blank text node
+            has_text = any(element.stripped_strings)
+            if has_text or element.attrs or element.find_all(recursive=False):
                 logger.debug("Visible as interactive element with content")
                 return True
             logger.debug("Invisible interactive element: no text, attributes, or children")
             return False
         
         # Check special elements
-        if element.name in ['img', 'svg', 'canvas', 'iframe']:
+        if category == _TAG_SPECIAL:
             logger.debug("Visible as special element")
             return True
         
         # Check text content
-        text = element.get_text(strip=True)
-        if not text and not element.find_all(recursive=False):
+        has_text = any(element.stripped_strings)
+        if not has_text and not element.find_all(recursive=False):
             logger.debug("Invisible: no text or children")
             return False
         
@@ -91,7 +102,7 @@ class HTMLSummarizer(HTMLSummarizerInterface):
                     logger.debug("Visible due to visible child")
                     return True
         
-        return bool(text)
+        return has_text
 
     def tag_to_role(self, tag_name: str, element: BeautifulSoup) -> Optional[str]:
         """Map an HTML tag to an accessibility role."""
@@ -160,8 +171,12 @@ class HTMLSummarizer(HTMLSummarizerInterface):
         logger.debug("No name found")
         return ''
 
-    def element_to_json(self, element: BeautifulSoup) -> Optional[Dict[str, Any]]:
-        """Convert an element to JSON representation, including visibility status."""
+    def _build_node(self, element: BeautifulSoup) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """Build the JSON node for a single element, without its children.
+
+        Returns the node and whether the element's children should be traversed,
+        or None when the element is filtered out.
+        """
         if not element.name:
             logger.warning(f"Skipping element with no tag name: {element}")
             return None
@@ -210,24 +225,83 @@ class HTMLSummarizer(HTMLSummarizerInterface):
         if element.get('haspopup'):
             node['haspopup'] = element['haspopup']
 
-        children = [
-            child_json for child in element.find_all(recursive=False)
-            if (child_json := self.element_to_json(child))
-        ]
-        if children:
-            node['children'] = children
-
         if text and role == 'text' and text != name and 'aria-label' not in attributes:
             node = {'role': 'text', 'name': text}
             if not is_visible:
                 node['visibility'] = 'hidden'
             logger.debug(f"Overwriting name for role=text to: {text}")
+            return node, False
 
-        logger.debug(f"Processed element: {element.name}, role: {role}, name: {node['name']}, visibility: {is_visible}, children: {len(children)}")
+        return node, True
+
+    def element_to_json(self, element: BeautifulSoup) -> Optional[Dict[str, Any]]:
+        """Convert an element to JSON representation, including visibility status."""
+        built = self._build_node(element)
+        if built is None:
+            return None
+        node, descend = built
+
+        children = []
+        if descend:
+            children = [
+                child_json for child in element.find_all(recursive=False)
+                if (child_json := self.element_to_json(child))
+            ]
+            if children:
+                node['children'] = children
+
+        logger.debug(f"Processed element: {element.name}, role: {node['role']}, name: {node['name']}, visibility: {'visibility' not in node}, children: {len(children)}")
         return node
 
-    def summarize_html(self, html_content: str) -> Dict[str, Any]:
-        """Convert HTML to JSON DOM for elements, including visibility status."""
+    def _flatten(self, root: BeautifulSoup) -> Dict[str, List[Any]]:
+        """Walk the tree once (iteratively, in document order) into parallel arrays.
+
+        Index i of every array describes the same node; ``parent[i]`` is the index
+        of its parent node, or -1 for the root.
+        """
+        roles: List[str] = []
+        names: List[str] = []
+        attrs: List[Optional[Dict[str, Any]]] = []
+        parent: List[int] = []
+        extra: List[Optional[Dict[str, Any]]] = []
+
+        stack = [(root, -1)]
+        while stack:
+            element, parent_idx = stack.pop()
+            built = self._build_node(element)
+            if built is None:
+                continue
+            node, descend = built
+            idx = len(roles)
+            roles.append(node.pop('role'))
+            names.append(node.pop('name'))
+            attrs.append(node.pop('attributes', None))
+            parent.append(parent_idx)
+            extra.append(node or None)
+            if descend:
+                stack.extend((child, idx) for child in reversed(element.find_all(recursive=False)))
+
+        return {'roles': roles, 'names': names, 'attrs': attrs, 'parent': parent, 'extra': extra}
+
+    @staticmethod
+    def _flat_to_nested(flat: Dict[str, List[Any]]) -> Dict[str, Any]:
+        """Rebuild the nested JSON DOM from the flat arrays produced by _flatten."""
+        nodes: List[Dict[str, Any]] = []
+        for role, name, attributes, parent_idx, extra in zip(
+            flat['roles'], flat['names'], flat['attrs'], flat['parent'], flat['extra']
+        ):
+            node = {'role': role, 'name': name}
+            if attributes:
+                node['attributes'] = attributes
+            if extra:
+                node.update(extra)
+            nodes.append(node)
+            if parent_idx >= 0:
+                nodes[parent_idx].setdefault('children', []).append(node)
+        return nodes[0]
+
+    def _parse_html(self, html_content: str) -> Optional[BeautifulSoup]:
+        """Parse HTML with the configured parser, falling back to html5lib."""
         if html_content is None:
             logger.error("html_content is None")
             raise ValueError("html_content cannot be None")
@@ -242,23 +316,55 @@ class HTMLSummarizer(HTMLSummarizerInterface):
                 logger.debug("Parsed HTML with html5lib fallback")
             except Exception as fallback_e:
                 logger.error(f"Fallback parser failed: {str(fallback_e)}")
-                return {'role': 'WebArea', 'name': '', 'children': []}
+                return None
+        return soup
+
+    def summarize_flat(self, html_content: str) -> Dict[str, List[Any]]:
+        """Convert HTML to a flat, structure-of-arrays DOM.
+
+        Returns a dict with parallel 'roles', 'names', 'attrs', 'parent' and 'extra'
+        lists (see _flatten). Index 0 is the WebArea root named after the page title.
+        """
+        soup = self._parse_html(html_content)
+        root = (soup.find('body') or soup) if soup is not None else None
+        title = soup.title.get_text(separator=' ', strip=True) if soup is not None and soup.title else ''
+        logger.debug(f"Title extracted: {title}")
+
+        flat = self._flatten(root) if root else None
+        if not flat or not flat['roles']:
+            if not root:
+                logger.warning("No body or root element found in HTML")
+            return {'roles': ['WebArea'], 'names': [title], 'attrs': [None], 'parent': [-1], 'extra': [None]}
+
+        flat['roles'][0] = 'WebArea'
+        flat['names'][0] = title
+        return flat
+
+    def summarize_html(self, html_content: str) -> Dict[str, Any]:
+        """Convert HTML to JSON DOM for elements, including visibility status."""
+        soup = self._parse_html(html_content)
+        if soup is None:
+            return {'role': 'WebArea', 'name': '', 'children': []}
 
         root = soup.find('body') or soup
         if not root:
             logger.warning("No body or root element found in HTML")
             return {'role': 'WebArea', 'name': '', 'children': []}
 
-        json_result = self.element_to_json(root)
         title = soup.title.get_text(separator=' ', strip=True) if soup.title else ''
         logger.debug(f"Title extracted: {title}")
 
-        if not json_result:
+        flat = self._flatten(root)
+        if not flat['roles']:
             return {'role': 'WebArea', 'name': title, 'children': []}
 
-        json_result['role'] = 'WebArea'
-        json_result['name'] = title
-        return json_result
+        flat['roles'][0] = 'WebArea'
+        flat['names'][0] = title
+        return self._flat_to_nested(flat)
+
+    def summarize_html_json(self, html_content: str) -> bytes:
+        """Convert HTML to the JSON DOM already serialized as UTF-8 JSON bytes."""
+        return orjson.dumps(self.summarize_html(html_content), option=orjson.OPT_NON_STR_KEYS)
 
     def load_test_html(self, file_path: str) -> str:
         """Load HTML from a file for testing."""
@@ -15,8 +15,8 @@ class AIClientInterface(ABC):
     """Abstract interface for AI clients."""
     
     @abstractmethod
-    async def send_prompt(self, prompt: str) -> AIResponse:
-        """Send prompt to AI and get response."""
+    async def send_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
+        """Send prompt to AI and get response. A static system_prompt is sent ahead of the prompt so providers can cache it."""
         pass
 
 class StepGeneratorInterface(ABC):
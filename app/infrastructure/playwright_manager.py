@@ -1,17 +1,24 @@
 # app/infrastructure/playwright_manager.py
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, AsyncGenerator
+from typing import Optional, Dict, Any, List, AsyncGenerator, Callable, Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 import inspect
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from app.domain.exceptions import SecurityException
-from typing import Set, Pattern
+from typing import Set, Pattern, Tuple, Literal, TYPE_CHECKING
+import ast
+import asyncio
 import re
+from urllib.parse import urlsplit
 
-from playwright.async_api import async_playwright, Browser, Page, Playwright, expect  # Add expect
 from app.utils.logger import get_logger
+from app.utils.config import CHROMIUM_LAUNCH_ARGS
 from app.domain.exceptions import (
     BrowserException,
     NavigationException,
@@ -19,9 +26,249 @@ from app.domain.exceptions import (
     ScreenshotException
 )
 
+# Optional RE2 (DFA) engine for the allow-list (pip install google-re2); it only matters
+# when ENFORCE_ALLOWED_ACTIONS is on, and buckets it can't express stay on `re`
+try:
+    import re2
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+except ImportError:
+    re2 = None
+
+# Playwright is imported lazily in start() so importing this module stays cheap
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright
+
 logger = get_logger(__name__)
 
-@dataclass
+# Leading "await " and "page." prefixes the AI may emit before an instruction
+_CLEAN_RE = re.compile(r'^(?:await\s+)?(?:page\.)?')
+# goto('url', { key: 'value', timeout: 5000 }) as emitted by the operator runner
+_GOTO_RE = re.compile(r"goto\(['\"](https?://[^'\"]+)['\"](?:,\s*\{([^}]+)\})?\)")
+_GOTO_OPTION_RE = re.compile(r"(\w+):\s*(?:['\"]([^'\"]+)['\"]|(\d+))")
+# JS option names (waitUntil) map onto the Python API's keyword arguments (wait_until)
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+# Leading http(s) URL literal of any other goto() form, e.g. goto('url', wait_until='load')
+_GOTO_URL_RE = re.compile(r"goto\(['\"](https?://[^'\"]+)['\"]\s*[,)]")
+# Calls that may trigger navigation or network activity worth waiting on
+_INTERACTIVE_VERBS = frozenset({"click", "fill", "select_option", "press", "type"})
+# Page reads answered directly, without validation, post-action waits or a screenshot
+READ_ONLY_VERBS = frozenset({"url", "title", "content"})
+_READ_ONLY_INSTRUCTIONS = frozenset(f"{verb}()" for verb in READ_ONLY_VERBS)
+
+# Post-action settle tuning: EWMA weight, fast-path threshold, the original fixed cap
+# and how many fast-path steps run before networkidle is probed again
+_SETTLE_ALPHA = 0.3
+_SETTLE_FAST_MS = 100.0
+_SETTLE_MAX_S = 5.0
+_SETTLE_REPROBE_EVERY = 5
+
+# Installed before any page script runs: counts DOM mutations for the current document
+_MUTATION_COUNTER_JS = """
+window.__mvp_mut = 0;
+new MutationObserver(() => { window.__mvp_mut++; }).observe(document, {
+    subtree: true, childList: true, attributes: true, characterData: true
+});
+"""
+# One round trip identifying the current DOM state: URL, document instance and mutation count
+_FINGERPRINT_JS = "() => [location.href, performance.timeOrigin, window.__mvp_mut ?? -1]"
+
+def _pattern_verb(pattern: Pattern) -> str:
+    """Return the literal leading call name of an allow-list pattern (e.g. 'goto', 'keyboard.press')."""
+    return pattern.pattern.split(r"\(", 1)[0].replace("\\.", ".")
+
+def _compile_union(pattern_texts: List[str]) -> Pattern:
+    """Compile pattern sources into one alternation so matching is a single regex call."""
+    unique = sorted(set(pattern_texts))
+    source = "|".join(f"(?:{text})" for text in unique)
+    if re2 is not None:
+        try:
+            return re2.compile(source, _RE2_OPTIONS)
+        except re2.error:
+            # e.g. lookbehind assertions, which a DFA can't represent
+            logger.debug("Allow-list bucket not supported by re2, using re: %s", source)
+    return re.compile(source, re.ASCII)
+
+def _build_action_dispatch(patterns: Set[Pattern]) -> Dict[str, Pattern]:
+    """Group allow-list patterns by their leading call name, one alternation per group."""
+    dispatch: Dict[str, List[str]] = {}
+    for pattern in patterns:
+        dispatch.setdefault(_pattern_verb(pattern), []).append(pattern.pattern)
+    return {verb: _compile_union(texts) for verb, texts in dispatch.items()}
+
+# Terminal calls accepted at the end of a locator(...)[.filter({...})][.locator(...)]* chain
+_CHAIN_VERBS = frozenset({"click", "fill", "type", "press"})
+
+def _scan_quoted(text: str, start: int) -> Tuple[Optional[str], int]:
+    """Read a quoted literal at text[start]; either quote character closes it, as in the allow-list."""
+    if start >= len(text) or text[start] not in "'\"":
+        return None, start
+    end = start + 1
+    while end < len(text) and text[end] not in "'\"":
+        end += 1
+    if end >= len(text):
+        return None, start
+    return text[start + 1:end], end + 1
+
+def _tokenize_calls(text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (name, argument source) for each call of a dotted chain in a single pass.
+
+    Quotes and nested brackets are tracked so a ')' inside a literal doesn't end a
+    call; iteration stops silently at the first segment that isn't a complete call.
+    """
+    pos, length = 0, len(text)
+    while True:
+        start = pos
+        while pos < length and (text[pos].isalnum() or text[pos] == "_"):
+            pos += 1
+        if pos == start or pos >= length or text[pos] != "(":
+            return
+        name = text[start:pos]
+        pos += 1
+        args_start, depth, quote = pos, 0, None
+        while pos < length:
+            char = text[pos]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in "'\"":
+                quote = char
+            elif char in "([{":
+                depth += 1
+            elif char in ")]}":
+                if depth == 0:
+                    break
+                depth -= 1
+            pos += 1
+        if pos >= length or text[pos] != ")":
+            return
+        yield name, text[args_start:pos]
+        pos += 1
+        if pos >= length or text[pos] != ".":
+            return
+        pos += 1
+
+def _single_quoted(args: str) -> Optional[str]:
+    """Return the value of an argument list made of exactly one non-empty quoted literal."""
+    value, end = _scan_quoted(args, 0)
+    return value if value and end == len(args) else None
+
+def _scan_arguments(args: str) -> Optional[Tuple[str, ...]]:
+    """Read quoted arguments, each optionally followed by ", 'second'"; None if anything else remains."""
+    values: List[str] = []
+    pos = 0
+    while True:
+        value, end = _scan_quoted(args, pos)
+        if value is None:
+            break
+        values.append(value)
+        pos = end
+        if args.startswith(",", pos):
+            after_comma = pos + 1
+            while after_comma < len(args) and args[after_comma].isspace():
+                after_comma += 1
+            second, end = _scan_quoted(args, after_comma)
+            if second is not None:
+                values.append(second)
+                pos = end
+    return tuple(values) if pos == len(args) else None
+
+def _parse_locator_chain(text: str) -> Optional[Tuple[str, str, Tuple[str, ...]]]:
+    """Parse a locator chain from its call tokens, returning (selector, verb, args) or None."""
+    calls = _tokenize_calls(text)
+    name, args = next(calls, (None, ""))
+    selector = _single_quoted(args) if name == "locator" else None
+    if selector is None:
+        return None
+
+    name, args = next(calls, (None, ""))
+    if name == "filter":
+        if len(args) <= 2 or args[0] != "{" or args.find("}") != len(args) - 1:
+            return None
+        name, args = next(calls, (None, ""))
+
+    while name == "locator":
+        if _single_quoted(args) is None:
+            return None
+        name, args = next(calls, (None, ""))
+
+    if name not in _CHAIN_VERBS:
+        return None
+    values = _scan_arguments(args)
+    return None if values is None else (selector, name, values)
+
+# JavaScript-style method names the AI sometimes emits, mapped to the Python API
+_CAMEL_ALIASES = {"selectOption": "select_option"}
+
+# A compiled instruction: called with the bound handler table and the page, it
+# performs the call chain and returns its result (often an awaitable)
+InstructionHandler = Callable[[Dict[str, Any], "Page"], Any]
+
+def _build_handler(node: ast.AST) -> InstructionHandler:
+    """Compile an instruction AST into nested closures, rejecting anything but literals, names, attributes and calls."""
+    if isinstance(node, ast.Call):
+        if any(isinstance(arg, ast.Starred) for arg in node.args) or any(kw.arg is None for kw in node.keywords):
+            raise SecurityException("Argument unpacking is not allowed in instructions")
+        func = _build_handler(node.func)
+        args = tuple(_build_handler(arg) for arg in node.args)
+        kwargs = tuple((kw.arg, _build_handler(kw.value)) for kw in node.keywords)
+        return lambda handlers, page: func(handlers, page)(
+            *[arg(handlers, page) for arg in args],
+            **{key: value(handlers, page) for key, value in kwargs}
+        )
+    if isinstance(node, ast.Attribute):
+        if node.attr.startswith("_"):
+            raise SecurityException(f"Access to private attribute '{node.attr}' is not allowed")
+        base = _build_handler(node.value)
+        attr = _CAMEL_ALIASES.get(node.attr, node.attr)
+        return lambda handlers, page: getattr(base(handlers, page), attr)
+    if isinstance(node, ast.Name):
+        if node.id.startswith("_"):
+            raise SecurityException(f"Access to private name '{node.id}' is not allowed")
+        name = _CAMEL_ALIASES.get(node.id, node.id)
+
+        def resolve(handlers: Dict[str, Any], page: Page) -> Any:
+            if name in handlers:
+                return handlers[name]
+            if hasattr(page, name):
+                return getattr(page, name)
+            raise ValueError(f"Unknown name in instruction: {name}")
+        return resolve
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        raise SecurityException(f"Unsupported expression in instruction: {ast.dump(node)}")
+    return lambda handlers, page: value
+
+@dataclass(slots=True, frozen=True)
+class ParsedInstruction:
+    """A compiled instruction plus what the parse learned about it."""
+    handler: InstructionHandler
+    interactive: bool  # final call is an action that may trigger network activity
+
+def _final_call_name(node: ast.AST) -> Optional[str]:
+    """Name of the outermost call in an expression, e.g. 'click' for locator('a').click()."""
+    if isinstance(node, ast.Call):
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            return _CAMEL_ALIASES.get(func.attr, func.attr)
+        if isinstance(func, ast.Name):
+            return _CAMEL_ALIASES.get(func.id, func.id)
+    return None
+
+@lru_cache(maxsize=1024)
+def _parse_instruction(instruction: str) -> ParsedInstruction:
+    """Parse a single Playwright expression (without the leading "await ") into a handler."""
+    try:
+        tree = ast.parse(instruction.strip().rstrip(";"), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid instruction syntax: {instruction} ({e.msg})")
+    return ParsedInstruction(
+        handler=_build_handler(tree.body),
+        interactive=_final_call_name(tree.body) in _INTERACTIVE_VERBS
+    )
+
+@dataclass(slots=True, frozen=True)
 class BrowserConfig:
     """Configuration for browser session."""
     headless: bool = True
@@ -29,9 +276,17 @@ class BrowserConfig:
     viewport_height: int = 1080
     timeout: int = 5000  # milliseconds
     screenshot_dir: str = "screenshots"
+    screenshot_format: str = "jpeg"  # "jpeg" or "png"
+    screenshot_quality: int = 70  # jpeg only
+    screenshot_full_page: bool = False
+    # Load state navigation waits for; networkidle stalls on pages with long-lived connections
+    wait_strategy: Literal["domcontentloaded", "load", "networkidle"] = "domcontentloaded"
     trace_dir: str = "traces"
+    launch_args: Tuple[str, ...] = CHROMIUM_LAUNCH_ARGS
+    # Off by default: containers usually lack the user namespaces Chromium's sandbox needs
+    chromium_sandbox: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of a step execution."""
     success: bool
@@ -54,8 +309,8 @@ class BrowserManagerInterface(ABC):
         pass
 
     @abstractmethod
-    async def execute_step(self, instruction: str) -> ExecutionResult:
-        """Execute a single instruction."""
+    async def execute_step(self, instruction: str, capture_screenshot: bool = True) -> ExecutionResult:
+        """Execute a single instruction, optionally skipping the step screenshot."""
         pass
 
     @abstractmethod
@@ -63,6 +318,20 @@ class BrowserManagerInterface(ABC):
         """Get current page DOM content."""
         pass
 
+    async def page_fingerprint(self) -> Optional[Tuple[Any, ...]]:
+        """Cheap identifier of the current DOM state, or None when it cannot be determined."""
+        return None
+
+    async def navigate(self, url: str, timeout: Optional[int] = None) -> ExecutionResult:
+        """Load url and wait for it to settle; page_url on the result is where it ended up."""
+        timeout_option = f", timeout: {timeout}" if timeout is not None else ""
+        # Percent-encode quotes so the URL cannot end the instruction's string literal early
+        quoted_url = url.replace("'", "%27").replace('"', "%22")
+        return await self.execute_step(f"goto('{quoted_url}', {{ wait_until: 'load'{timeout_option} }})")
+
+# Browsers are pooled and shared per (headless, launch_args, chromium_sandbox)
+_PoolKey = Tuple[bool, Tuple[str, ...], bool]
+
 class PlaywrightManager(BrowserManagerInterface):
     """Manages Playwright browser sessions and interactions."""
     ALLOWED_ACTIONS: Set[Pattern] = {
@@ -86,12 +355,6 @@ class PlaywrightManager(BrowserManagerInterface):
         re.compile(r"select_option\(['\"]([^'\"]+)['\"], ['\"]([^'\"]+)['\"]\)"),
         re.compile(r"locator\(['\"](.+?)['\"]\)\.fill\(['\"](.+?)['\"]\)"),
         re.compile(r"locator\(['\"](.+?)['\"]\)\.type\(['\"](.+?)['\"]\)"),
-        re.compile(
-            r"locator\(['\"][^'\"]+['\"]\)"
-            r"(?:\.filter\(\{[^\}]+\}\))?"
-            r"(?:\.locator\(['\"][^'\"]+['\"]\))*"
-            r"\.(click|fill|type|press)\((?:['\"][^'\"]*['\"](?:,\s*['\"][^'\"]*['\"])?)*\)"
-        ),
         # Mouse interactions
         re.compile(r"hover\(['\"]([^'\"]+)['\"]\)"),
         re.compile(r"focus\(['\"]([^'\"]+)['\"]\)"),
@@ -114,23 +377,64 @@ class PlaywrightManager(BrowserManagerInterface):
         re.compile(r"expect\(locator\(\\'\[role=\"[^\"]+\"\]\\'\)\)\.to_be_visible\(\)"),
         re.compile(r"url\(\)")
     }
+    # Patterns are anchored at the call name, so an instruction can only match the
+    # bucket of its own leading call name (the text before the first '(').
+    _ACTION_DISPATCH: Dict[str, Pattern] = _build_action_dispatch(ALLOWED_ACTIONS)
+    # Allow-list enforcement is disabled until the patterns cover the instruction
+    # formats requested in the gherkin_to_playwright prompt.
+    ENFORCE_ALLOWED_ACTIONS: bool = False
+
+    # Shared template every session context is created from
+    CONTEXT_OPTIONS: Dict[str, Any] = {
+        "java_script_enabled": True,
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "locale": "en-US",
+        "timezone_id": "America/New_York",
+        "ignore_https_errors": True,
+    }
+    # Directories already created by an earlier instance in this process
+    _dirs_created: Set[str] = set()
+    # Launched browsers kept warm between sessions, keyed by launch options. Entries
+    # remember their event loop because Playwright connections can't cross loops.
+    BROWSER_POOL_SIZE: int = 2
+    _browser_pool: Dict[_PoolKey, "asyncio.Queue[Tuple[asyncio.AbstractEventLoop, Playwright, Browser]]"] = {}
+    # Browser currently checked out per launch options as [loop, playwright, browser, sessions];
+    # concurrent sessions on the same loop share it, each in its own context
+    _active_browsers: Dict[_PoolKey, List[Any]] = {}
+    # Checkout in flight per launch options as (loop, task)
+    _pending_checkouts: Dict[_PoolKey, Tuple[asyncio.AbstractEventLoop, asyncio.Task]] = {}
 
     def __init__(
         self,
         config: Optional[BrowserConfig] = None,
-        start_url: Optional[str] = None
+        start_url: Optional[str] = None,
+        post_nav_selectors: Optional[Dict[str, str]] = None
     ):
         self.config = config or BrowserConfig()
         self.start_url = start_url
+        # Selectors to wait for after goto(), keyed by a substring of the target URL
+        self._post_nav_selectors: Dict[str, str] = dict(post_nav_selectors or {})
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._page: Optional[Page] = None
         self._context = None  # Initialize _context
+        self._handlers: Dict[str, Any] = {}
+        self._last_url: Optional[str] = None
+        self._settle_ms_by_origin: Dict[str, float] = {}
+        self._fast_settles_by_origin: Dict[str, int] = {}
+        # Step screenshots are captured inline and written in the background, at most four at a time
+        self._screenshot_sem = asyncio.Semaphore(4)
+        self._pending_screenshots: List[asyncio.Task] = []
+        self._io_pool: Optional[ThreadPoolExecutor] = None
         self._setup_directories()
 
     def _setup_directories(self) -> None:
-        Path(self.config.screenshot_dir).mkdir(parents=True, exist_ok=True)
-        Path(self.config.trace_dir).mkdir(parents=True, exist_ok=True)
+        self._screenshot_dir_path = Path(self.config.screenshot_dir)
+        self._screenshot_dir_str = str(self._screenshot_dir_path)
+        for directory in (self.config.screenshot_dir, self.config.trace_dir):
+            if directory not in self._dirs_created:
+                Path(directory).mkdir(parents=True, exist_ok=True)
+                self._dirs_created.add(directory)
 
     @property
     def page(self) -> Optional[Page]:
@@ -141,135 +445,307 @@ class PlaywrightManager(BrowserManagerInterface):
     
     async def start(self) -> None:
         try:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.config.headless
-            )
-            self._context = await self._browser.new_context(
-                java_script_enabled=True,
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                locale="en-US",
-                timezone_id="America/New_York",
-                ignore_https_errors=True
-            )
+            # Screenshot bytes are written to disk off the event loop
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot-io")
+            self._playwright, self._browser = await self._acquire_browser(self.config)
+            self._context = await self._browser.new_context(**self.CONTEXT_OPTIONS)
             self._page = await self._context.new_page()
             await self._configure_page()
 
             if self.start_url:
                 await self.navigate_to(self.start_url)
         except Exception as e:
-            logger.error(f"Failed to start browser: {str(e)}")
+            logger.error("Failed to start browser: %s", e)
             await self.stop()
             raise BrowserException(f"Browser startup failed: {str(e)}")
 
+    @staticmethod
+    def _pool_key(config: BrowserConfig) -> _PoolKey:
+        """Every option passed to chromium.launch, so browsers are only shared between identical launches."""
+        return (config.headless, config.launch_args, config.chromium_sandbox)
+
+    @classmethod
+    async def _acquire_browser(cls, config: BrowserConfig) -> Tuple[Playwright, Browser]:
+        """Share the browser already in use on this loop, else check one out of the pool or launch one."""
+        loop = asyncio.get_running_loop()
+        key = cls._pool_key(config)
+        while True:
+            active = cls._active_browsers.get(key)
+            if active is not None and active[0] is loop and active[2].is_connected():
+                active[3] += 1
+                logger.debug("Sharing active browser across %d sessions", active[3])
+                return active[1], active[2]
+
+            # Concurrent first sessions wait on a single checkout instead of each launching
+            pending = cls._pending_checkouts.get(key)
+            if pending is None or pending[0] is not loop:
+                pending = (loop, loop.create_task(cls._checkout_active_browser(config, loop, key)))
+                cls._pending_checkouts[key] = pending
+            await asyncio.shield(pending[1])
+
+    @classmethod
+    async def _checkout_active_browser(
+        cls, config: BrowserConfig, loop: asyncio.AbstractEventLoop, key: _PoolKey
+    ) -> None:
+        try:
+            playwright, browser = await cls._checkout_browser(config, loop)
+            cls._active_browsers[key] = [loop, playwright, browser, 0]
+        finally:
+            pending = cls._pending_checkouts.get(key)
+            if pending is not None and pending[1] is asyncio.current_task():
+                del cls._pending_checkouts[key]
+
+    @classmethod
+    async def _checkout_browser(cls, config: BrowserConfig, loop: asyncio.AbstractEventLoop) -> Tuple[Playwright, Browser]:
+        queue = cls._browser_pool.get(cls._pool_key(config))
+        while queue is not None and not queue.empty():
+            owner_loop, playwright, browser = queue.get_nowait()
+            if owner_loop is loop and browser.is_connected():
+                logger.debug("Reusing pooled browser")
+                return playwright, browser
+            await cls._discard_browser(owner_loop, playwright, browser)
+        return await cls._launch_browser(config)
+
+    @staticmethod
+    async def _launch_browser(config: BrowserConfig) -> Tuple[Playwright, Browser]:
+        from playwright.async_api import async_playwright
+
+        playwright = await async_playwright().start()
+        try:
+            browser = await playwright.chromium.launch(
+                headless=config.headless,
+                args=list(config.launch_args),
+                chromium_sandbox=config.chromium_sandbox
+            )
+        except Exception:
+            await playwright.stop()
+            raise
+        return playwright, browser
+
+    @classmethod
+    async def _release_browser(cls, config: BrowserConfig, playwright: Playwright, browser: Browser) -> None:
+        """Return a browser to the pool, closing it when the pool is full or it has disconnected."""
+        loop = asyncio.get_running_loop()
+        key = cls._pool_key(config)
+        active = cls._active_browsers.get(key)
+        if active is not None and active[2] is browser:
+            active[3] -= 1
+            if active[3] > 0 and browser.is_connected():
+                return  # Still serving other sessions
+            del cls._active_browsers[key]
+        queue = cls._browser_pool.get(key)
+        if queue is None:
+            queue = cls._browser_pool[key] = asyncio.Queue(maxsize=cls.BROWSER_POOL_SIZE)
+        if browser.is_connected() and not queue.full():
+            queue.put_nowait((loop, playwright, browser))
+            return
+        await cls._discard_browser(loop, playwright, browser)
+
+    @staticmethod
+    async def _discard_browser(owner_loop: asyncio.AbstractEventLoop, playwright: Playwright, browser: Browser) -> None:
+        if owner_loop is not asyncio.get_running_loop() or owner_loop.is_closed():
+            # Its connection belongs to another loop; nothing can be awaited on it here
+            return
+        try:
+            await browser.close()
+            await playwright.stop()
+        except Exception as e:
+            logger.warning("Failed to close pooled browser: %s", e)
+
+    @classmethod
+    async def warm_pool(cls, config: BrowserConfig, size: int = 1) -> None:
+        """Launch browsers into the pool ahead of the first session that needs them."""
+        # Hold every checkout until the loop ends so each one is a distinct browser
+        loop = asyncio.get_running_loop()
+        checked_out = []
+        try:
+            for _ in range(min(size, cls.BROWSER_POOL_SIZE)):
+                checked_out.append(await cls._checkout_browser(config, loop))
+        finally:
+            for playwright, browser in checked_out:
+                await cls._release_browser(config, playwright, browser)
+
+    @classmethod
+    async def shutdown_pool(cls) -> None:
+        """Close every pooled browser; call once at program exit."""
+        for queue in cls._browser_pool.values():
+            while not queue.empty():
+                await cls._discard_browser(*queue.get_nowait())
+        cls._browser_pool.clear()
+
     async def _configure_page(self) -> None:
         if self._page:
+            from playwright.async_api import expect
+
             await self._page.set_viewport_size({
                 "width": self.config.viewport_width,
                 "height": self.config.viewport_height
             })
             self._page.set_default_timeout(self.config.timeout)
+            await self._page.add_init_script(_MUTATION_COUNTER_JS)
+            # Bound entry points instructions may start from; anything else resolves on the page
+            self._handlers = {
+                "page": self._page,
+                "expect": expect,
+                "keyboard": self._page.keyboard,
+                "locator": self._page.locator,
+                "get_by_role": self._page.get_by_role,
+                "get_by_label": self._page.get_by_label,
+                "goto": self._page.goto,
+            }
 
     async def stop(self) -> None:
         try:
+            await self.wait_for_screenshots()
             if self._context:
                 await self._context.close()
-            if self._browser:
-                await self._browser.close()
-            if self._playwright:
+            if self._browser and self._playwright:
+                await self._release_browser(self.config, self._playwright, self._browser)
+            elif self._playwright:
                 await self._playwright.stop()
         except Exception as e:
-            logger.error(f"Error during browser cleanup: {str(e)}")
+            logger.error("Error during browser cleanup: %s", e)
         finally:
             self._context = None
             self._browser = None
             self._playwright = None
             self._page = None
+            self._handlers = {}
+            if self._io_pool:
+                # Pending writes were awaited above; don't block the loop joining the threads
+                self._io_pool.shutdown(wait=False)
+                self._io_pool = None
 
     async def navigate_to(self, url: str) -> None:
         if not self._page:
             raise BrowserException("Browser not initialized")
         try:
-            await self._page.goto(url, wait_until="networkidle")
+            await self._page.goto(url, wait_until=self.config.wait_strategy)
+            await self._wait_for_post_nav_selectors(url)
         except Exception as e:
             raise NavigationException(f"Navigation failed: {str(e)}")
 
-    def _is_instruction_allowed(self, instruction: str) -> bool:
-        #clean_instruction = instruction.replace('await ', '').replace('page.', '')
-        #return any(pattern.match(clean_instruction) for pattern in self.ALLOWED_ACTIONS)
-        return True
+    async def _wait_for_post_nav_selectors(self, url: str) -> None:
+        """Wait for the opt-in selectors registered for this URL, if any."""
+        for host, selector in self._post_nav_selectors.items():
+            if host in url:
+                await self._page.wait_for_selector(selector, timeout=10000)
+
+    async def navigate(self, url: str, timeout: Optional[int] = None) -> ExecutionResult:
+        """Load url in a single goto that waits for the configured wait_strategy."""
+        if not self._page:
+            raise BrowserException("Browser not initialized")
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        start_ns = time.perf_counter_ns()
+        timeout = timeout if timeout is not None else self.config.timeout
+        wait_until = self.config.wait_strategy
+        try:
+            try:
+                await self._page.goto(url, wait_until=wait_until, timeout=timeout)
+            except PlaywrightTimeoutError:
+                if wait_until != "networkidle":
+                    raise
+                # Pages that keep connections open never go idle; loaded is good enough.
+                # Returns at once when 'load' has already fired, and raises when it hasn't
+                logger.debug("networkidle not reached for %s, falling back to load", url)
+                await self._page.wait_for_load_state("load", timeout=100)
+            await self._wait_for_post_nav_selectors(url)
+            self._last_url = self._page.url
+            return ExecutionResult(
+                success=True,
+                screenshot_path=await self._schedule_screenshot(),
+                page_url=self._last_url,
+                execution_time=(time.perf_counter_ns() - start_ns) / 1e9
+            )
+        except Exception as e:
+            logger.error("Navigation to %s failed: %s", url, e)
+            return ExecutionResult(
+                success=False,
+                screenshot_path=None,
+                error_message=str(e),
+                page_url=self._safe_url(),
+                execution_time=(time.perf_counter_ns() - start_ns) / 1e9
+            )
 
-    async def execute_step(self, instruction: str) -> ExecutionResult:
+    def _is_instruction_allowed(self, clean_instruction: str) -> bool:
+        """Check an instruction already stripped of its leading "await "/"page." against the allow-list."""
+        if not self.ENFORCE_ALLOWED_ACTIONS:
+            return True
+        # The allow-list is written against the snake_case Python API
+        return _match_allowed(clean_instruction.replace("selectOption", "select_option"))
+
+    async def execute_step(self, instruction: str, capture_screenshot: bool = True) -> ExecutionResult:
         if not self._page:
             raise BrowserException("Browser not initialized")
 
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         screenshot_path = None
         result_value = None
 
         try:
+            # Strip a leading "await " / "page." once; validation and dispatch share it
+            clean_instruction = _CLEAN_RE.sub('', instruction, count=1)
+
+            # Zero-argument page reads change nothing: skip validation and the screenshot
+            if clean_instruction in _READ_ONLY_INSTRUCTIONS:
+                verb = clean_instruction[:-2]
+                self._last_url = self._page.url
+                result_value = self._last_url if verb == "url" else await getattr(self._page, verb)()
+                return ExecutionResult(
+                    success=True,
+                    screenshot_path=None,
+                    page_url=self._last_url,
+                    execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                    result=result_value
+                )
+
             # Check if instruction is allowed
-            if not self._is_instruction_allowed(instruction):
+            if not self._is_instruction_allowed(clean_instruction):
                 raise SecurityException(f"Instruction not allowed: {instruction}")
 
-            logger.debug(f"Executing instruction: {instruction}")
+            logger.debug("Executing instruction: %s", clean_instruction)
 
-            # Normalize instruction: replace selectOption with select_option
-            instruction = instruction.replace("selectOption", "select_option")
-
-            # Handle goto with options
-            if instruction.startswith("goto("):
-                # Match goto('url', { options }) or goto('url')
-                match = re.match(r"goto\(['\"](https?://[^'\"]+)['\"](?:,\s*\{([^}]+)\})?\)", instruction)
-                if match:
-                    url = match.group(1)
-                    options_str = match.group(2) or ""
+            # Handle goto with options; only http(s) URLs may be navigated to
+            if clean_instruction.startswith("goto("):
+                goto_match = _GOTO_RE.match(clean_instruction)
+                if goto_match:
+                    url = goto_match.group(1)
+                    options_str = goto_match.group(2) or ""
                     options = {}
                     if options_str:
                         # Parse options (e.g., wait_until: 'load', timeout: 5000)
                         # Handle both quoted values and numbers
-                        pairs = re.findall(r"(\w+):\s*(?:['\"]([^'\"]+)['\"]|(\d+))", options_str)
+                        pairs = _GOTO_OPTION_RE.findall(options_str)
                         for key, quoted_value, numeric_value in pairs:
+                            key = _CAMEL_BOUNDARY_RE.sub("_", key).lower()
                             value = quoted_value if quoted_value else numeric_value
                             options[key] = value if key != 'timeout' else int(value)
-                        logger.debug(f"Parsed goto options: {options}")
+                        logger.debug("Parsed goto options: %s", options)
+                    # goto() already waits for its wait_until state, which implies
+                    # domcontentloaded; callers wanting networkidle ask for it there
+                    options.setdefault('wait_until', self.config.wait_strategy)
                     await self._page.goto(url, **options)
-                    # Additional waits as in original
-                    try:
-                        await self._page.wait_for_load_state('networkidle', timeout=5000)
-                        await self._page.wait_for_load_state('domcontentloaded')
-                        if "google.com" in url:
-                            await self._page.wait_for_selector('input[name="q"]', timeout=10000)
-                        current_url = self._page.url
-                        if not current_url or "about:blank" in current_url:
-                            raise ElementNotFoundException("Page did not load properly")
-                    except Exception as wait_error:
-                        logger.warning(f"Additional waiting failed: {str(wait_error)}")
-                    result_value = None
                 else:
-                    raise ValueError(f"Invalid goto instruction: {instruction}")
-
-            # Create execution context for other instructions
+                    # Keyword options as the prompt asks for: goto('url', wait_until='networkidle')
+                    url_match = _GOTO_URL_RE.match(clean_instruction)
+                    if not url_match:
+                        raise ValueError(f"Invalid goto instruction: {instruction}")
+                    url = url_match.group(1)
+                    await _parse_instruction(clean_instruction).handler(self._handlers, self._page)
+                try:
+                    await self._wait_for_post_nav_selectors(url)
+                    current_url = self._page.url
+                    if not current_url or "about:blank" in current_url:
+                        raise ElementNotFoundException("Page did not load properly")
+                except Exception as wait_error:
+                    logger.warning("Additional waiting failed: %s", wait_error)
+                result_value = None
+
+            # Dispatch other instructions through the bound handler table
             else:
-                exec_globals = {
-                    "page": self._page,
-                    "expect": expect,
-                    "keyboard": self._page.keyboard,
-                    "locator": self._page.locator,
-                    "get_by_role": self._page.get_by_role,
-                    "get_by_label": self._page.get_by_label,
-                    "goto": self._page.goto,
-                    "url": self._page.url,
-                    "__builtins__": {},  # Restrict builtins for safety
-                }
-
-                # Handle await
-                if instruction.startswith("await "):
-                    instruction = instruction[6:]  # Remove "await "
-
-                # Execute instruction
-                code = compile(instruction, "<string>", "eval")
-                result = eval(code, exec_globals)
+                parsed = _parse_instruction(clean_instruction)
+                result = parsed.handler(self._handlers, self._page)
 
                 # Handle awaitable results
                 if inspect.isawaitable(result):
@@ -277,65 +753,149 @@ class PlaywrightManager(BrowserManagerInterface):
                 else:
                     result_value = result
 
-                # Post-action wait for interactive actions
-                if any(action in instruction for action in ['click', 'fill', 'select_option', 'press']):
-                    try:
-                        await self._page.wait_for_load_state('networkidle', timeout=5000)
-                    except Exception as wait_error:
-                        logger.debug(f"Post-action waiting skipped: {str(wait_error)}")
+                # Post-action wait for interactive actions; read-only calls and assertions skip it
+                if parsed.interactive:
+                    await self._wait_for_settle()
 
             # Take screenshot
-            screenshot_path = await self._take_screenshot()
+            if capture_screenshot:
+                screenshot_path = await self._schedule_screenshot()
 
-            execution_time = (datetime.now() - start_time).total_seconds()
+            self._last_url = self._page.url
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             return ExecutionResult(
                 success=True,
                 screenshot_path=screenshot_path,
-                page_url=self._page.url,
+                page_url=self._last_url,
                 execution_time=execution_time,
                 result=result_value
             )
 
         except SecurityException as e:
-            logger.error(f"Security violation: {str(e)}")
+            logger.error("Security violation: %s", e)
             return ExecutionResult(
                 success=False,
                 screenshot_path=None,
                 error_message=str(e),
-                page_url=self._page.url if self._page else None,
-                execution_time=(datetime.now() - start_time).total_seconds(),
+                page_url=self._safe_url(),
+                execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
                 result=None
             )
 
         except Exception as e:
-            logger.error(f"Step execution failed: {str(e)}")
+            logger.error("Step execution failed: %s", e)
             try:
                 screenshot_path = await self._take_screenshot("error")
             except Exception as screenshot_error:
-                logger.error(f"Failed to take error screenshot: {str(screenshot_error)}")
-            execution_time = (datetime.now() - start_time).total_seconds()
+                logger.error("Failed to take error screenshot: %s", screenshot_error)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             return ExecutionResult(
                 success=False,
                 screenshot_path=screenshot_path,
                 error_message=str(e),
-                page_url=self._page.url if self._page else None,
+                page_url=self._safe_url(),
                 execution_time=execution_time,
                 result=None
             )
 
+    def _safe_url(self) -> Optional[str]:
+        """Current page URL for error results, falling back to the last one a step reported."""
+        if self._page:
+            try:
+                return self._page.url
+            except Exception:
+                pass
+        return self._last_url
+
+    async def _wait_for_settle(self) -> None:
+        """Wait for the page to settle after an action, bounded by the origin's observed settle time."""
+        origin = urlsplit(self._page.url).netloc
+        estimate = self._settle_ms_by_origin.get(origin)
+        if estimate is not None and estimate < _SETTLE_FAST_MS:
+            # Every few fast steps fall through and re-measure, so an origin that slowed down is noticed
+            fast_steps = self._fast_settles_by_origin.get(origin, 0) + 1
+            self._fast_settles_by_origin[origin] = fast_steps % _SETTLE_REPROBE_EVERY
+            if fast_steps < _SETTLE_REPROBE_EVERY:
+                try:
+                    await self._page.wait_for_load_state('domcontentloaded')
+                except Exception as wait_error:
+                    logger.debug("Post-action waiting skipped: %s", wait_error)
+                return
+
+        timeout = _SETTLE_MAX_S if estimate is None else min(_SETTLE_MAX_S, max(0.2, 2 * estimate / 1000))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            await asyncio.wait_for(self._page.wait_for_load_state('networkidle'), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.debug("Post-action networkidle not reached within %.2fs for %s", timeout, origin)
+        except Exception as wait_error:
+            logger.debug("Post-action waiting skipped: %s", wait_error)
+        elapsed_ms = (loop.time() - started) * 1000
+        self._settle_ms_by_origin[origin] = (
+            elapsed_ms if estimate is None
+            else _SETTLE_ALPHA * elapsed_ms + (1 - _SETTLE_ALPHA) * estimate
+        )
+
+    def _screenshot_path(self, prefix: str) -> str:
+        now_ns = time.time_ns()
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now_ns // 1_000_000_000))
+        return f"{self._screenshot_dir_str}/{prefix}_{timestamp}_{now_ns // 1000 % 1_000_000:06d}.{self.config.screenshot_format}"
+
+    async def _capture_bytes(self) -> bytes:
+        image_type = self.config.screenshot_format
+        return await self._page.screenshot(
+            full_page=self.config.screenshot_full_page,
+            type=image_type,
+            quality=self.config.screenshot_quality if image_type == "jpeg" else None,
+            animations="disabled",
+            caret="hide"
+        )
+
+    async def _write_bytes(self, filepath: str, image: bytes) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._io_pool, Path(filepath).write_bytes, image)
+
+    async def _capture(self, filepath: str) -> None:
+        await self._write_bytes(filepath, await self._capture_bytes())
+
     async def _take_screenshot(self, prefix: str = "step") -> Optional[str]:
         if not self._page:
             raise BrowserException("Browser not initialized")
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            filename = f"{prefix}_{timestamp}.png"
-            filepath = str(Path(self.config.screenshot_dir) / filename)
-            await self._page.screenshot(path=filepath, full_page=True)
+            filepath = self._screenshot_path(prefix)
+            await self._capture(filepath)
             return filepath
         except Exception as e:
-            logger.error(f"Screenshot failed: {str(e)}")
+            logger.error("Screenshot failed: %s", e)
             raise ScreenshotException(f"Failed to take screenshot: {str(e)}")
 
+    async def _schedule_screenshot(self, prefix: str = "step") -> Optional[str]:
+        """Capture the page as it is now and write the file in the background; returns its path."""
+        if not self._page:
+            raise BrowserException("Browser not initialized")
+        filepath = self._screenshot_path(prefix)
+        try:
+            image = await self._capture_bytes()
+        except Exception as e:
+            logger.error("Screenshot failed for %s: %s", filepath, e)
+            return None
+        task = asyncio.create_task(self._write_screenshot_guarded(filepath, image))
+        self._pending_screenshots.append(task)
+        task.add_done_callback(self._pending_screenshots.remove)
+        return filepath
+
+    async def _write_screenshot_guarded(self, filepath: str, image: bytes) -> None:
+        async with self._screenshot_sem:
+            try:
+                await self._write_bytes(filepath, image)
+            except Exception as e:
+                logger.error("Background screenshot write failed for %s: %s", filepath, e)
+
+    async def wait_for_screenshots(self) -> None:
+        """Wait until every background screenshot has been written."""
+        if self._pending_screenshots:
+            await asyncio.gather(*list(self._pending_screenshots), return_exceptions=True)
+
     async def get_page_content(self) -> str:
         if not self._page:
             raise BrowserException("Browser not initialized")
@@ -344,6 +904,18 @@ class PlaywrightManager(BrowserManagerInterface):
         except Exception as e:
             raise BrowserException(f"Failed to get page content: {str(e)}")
 
+    async def page_fingerprint(self) -> Optional[Tuple[Any, ...]]:
+        """Return (url, document origin time, mutation count); equal values mean the DOM is unchanged."""
+        if not self._page:
+            return None
+        try:
+            fingerprint = await self._page.evaluate(_FINGERPRINT_JS)
+        except Exception as e:
+            logger.debug("Page fingerprint unavailable: %s", e)
+            return None
+        # -1: the counter was not installed on this document, so changes cannot be tracked
+        return tuple(fingerprint) if fingerprint[2] >= 0 else None
+
     async def __aenter__(self) -> 'PlaywrightManager':
         await self.start()
         return self
@@ -351,6 +923,15 @@ class PlaywrightManager(BrowserManagerInterface):
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.stop()
 
+@lru_cache(maxsize=1024)
+def _match_allowed(clean_instruction: str) -> bool:
+    """Cached allow-list lookup so repeated instructions skip the regex work."""
+    verb = clean_instruction.split("(", 1)[0]
+    pattern = PlaywrightManager._ACTION_DISPATCH.get(verb)
+    if pattern is not None and pattern.match(clean_instruction) is not None:
+        return True
+    return verb == "locator" and _parse_locator_chain(clean_instruction) is not None
+
 def create_browser_manager(
     browser_type: str = "playwright",
     config: Optional[BrowserConfig] = None,
@@ -1,13 +1,21 @@
 # app/infrastructure/snapshot_storage.py
 from typing import Dict, Any
-import json
+import orjson
+
+# Snapshots are appended as JSON Lines: one compact object per line, so each save
+# writes only the new record and the history can be tailed cheaply
+_DUMP_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+_WRITE_BUFFER = 1 << 20
+
+def _append_jsonl(snapshot: Any, file_path: str) -> None:
+    data = orjson.dumps(snapshot, option=_DUMP_OPTIONS)
+    with open(file_path, mode='ab', buffering=_WRITE_BUFFER) as f:
+        f.write(data)
 
 class SnapshotStorage:
-    def save_snapshot(self, snapshot: Dict[str, Any], file_path: str = "snapshot_json.log") -> None:
-        with open(file_path, mode='w', encoding='utf-8') as f:
-            json.dump(snapshot, f, indent=2)
+    def save_snapshot(self, snapshot: Dict[str, Any], file_path: str = "snapshot_json.jsonl") -> None:
+        _append_jsonl(snapshot, file_path)
 
 class SnapshotHTMLStorage:
-    def save_snapshot(self, snapshot: Dict[str, Any], file_path: str = "snapshot_html_json.log") -> None:
-        with open(file_path, mode='w', encoding='utf-8') as f:
-            json.dump(snapshot, f, indent=2)
\ No newline at end of file
+    def save_snapshot(self, snapshot: Dict[str, Any], file_path: str = "snapshot_html_json.jsonl") -> None:
+        _append_jsonl(snapshot, file_path)
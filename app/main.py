@@ -3,11 +3,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
+import asyncio
 import os
+from typing import Optional
 
 from app.api.routes import api_router
 from app.utils.logger import get_logger
 from app.utils.config import get_settings
+from app.infrastructure.playwright_manager import PlaywrightManager, BrowserConfig
+from app.services.health import HealthChecker
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -21,37 +25,79 @@ app = FastAPI(
 # CORS middleware (adjust origins as needed)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Change to your frontend domain(s) in production
+    allow_origins=settings.cors_origins,  # set CORS_ORIGINS to your frontend domain(s) in production
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
-
-# Mount screenshots directory
+# Static assets and screenshots are served by the proxy when one fronts the app,
+# keeping that traffic off the event loop
 screenshots_dir = settings.browser_config.screenshot_dir
-if os.path.exists(screenshots_dir):
-    app.mount("/screenshots", StaticFiles(directory=screenshots_dir), name="screenshots")
+if settings.behind_proxy:
+    logger.info("Behind proxy: /static and /screenshots are not mounted")
 else:
-    logger.warning(f"Screenshots directory {screenshots_dir} does not exist")
+    # Mount static files
+    app.mount("/static", StaticFiles(directory="app/static"), name="static")
+
+    # Mount screenshots directory
+    if os.path.exists(screenshots_dir):
+        app.mount("/screenshots", StaticFiles(directory=screenshots_dir), name="screenshots")
+    else:
+        logger.warning(f"Screenshots directory {screenshots_dir} does not exist")
+
+_system_sampler: Optional[asyncio.Task] = None
+
+@app.on_event("startup")
+async def warm_browser_pool():
+    if settings.browser_config.pool_prewarm > 0:
+        # Operator runs default to a headed browser, so warm that configuration
+        try:
+            await PlaywrightManager.warm_pool(
+                BrowserConfig(headless=False),
+                size=settings.browser_config.pool_prewarm
+            )
+        except Exception as e:
+            logger.warning(f"Browser pool warm-up failed: {str(e)}")
+
+@app.on_event("startup")
+async def start_system_sampler():
+    global _system_sampler
+    _system_sampler = asyncio.create_task(HealthChecker.sample_system())
+
+@app.on_event("shutdown")
+async def close_browser_pool():
+    await PlaywrightManager.shutdown_pool()
+
+@app.on_event("shutdown")
+async def stop_system_sampler():
+    if _system_sampler is not None:
+        _system_sampler.cancel()
 
 # Include all API routes
 app.include_router(api_router, prefix="/api")
 
+def _stat_page(file_path: str) -> Optional[os.stat_result]:
+    """Stat a static page once; FileResponse reuses the result instead of stat-ing again."""
+    try:
+        return os.stat(file_path)
+    except FileNotFoundError:
+        return None
+
 # Root endpoint to serve the HTML file
 @app.get("/", tags=["Root"])
 async def root():
     logger.debug("Serving root endpoint")
-    return FileResponse("app/static/index.html")
+    file_path = "app/static/index.html"
+    return FileResponse(file_path, stat_result=_stat_page(file_path))
 
 # New endpoint to serve the test webpage
 @app.get("/web-app", tags=["Test Page"])
 async def serve_test_page():
     file_path = "app/static/web-app.html"
-    if os.path.exists(file_path):
-        return FileResponse(file_path)
+    stat_result = _stat_page(file_path)
+    if stat_result is not None:
+        return FileResponse(file_path, stat_result=stat_result)
     else:
         logger.error(f"Test page not found at {file_path}")
         return {"error": "Test page not found"}
@@ -60,8 +106,9 @@ async def serve_test_page():
 async def serve_test_page_v2():
     logger.debug("Serving test page: web-app-v2.html")
     file_path = "app/static/web-app-v2.html"
-    if os.path.exists(file_path):
-        return FileResponse(file_path)
+    stat_result = _stat_page(file_path)
+    if stat_result is not None:
+        return FileResponse(file_path, stat_result=stat_result)
     else:
         logger.error(f"Test page not found at {file_path}")
         return {"error": "Test page V2 not found"}
\ No newline at end of file
@@ -1,6 +1,8 @@
 # app/services/health.py
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+import asyncio
+import time
 import psutil
 from datetime import datetime
 
@@ -8,12 +10,47 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prime psutil's CPU counters so the first non-blocking reading has a baseline
+psutil.cpu_percent(interval=None)
+
 class HealthChecker:
     """Service for checking application health status."""
 
     # Thresholds for system health
     CPU_THRESHOLD = 90.0
     MEMORY_THRESHOLD = 90.0
+    # Seconds any single component check may take before it is reported unhealthy
+    COMPONENT_TIMEOUT = 2.0
+
+    # CPU and memory are sampled in the background and probes read the cached values,
+    # so the sampling rate is independent of the probe rate. Probes only call psutil
+    # themselves until the sampler's first reading exists.
+    CPU_SAMPLE_INTERVAL = 2.0
+    _cpu_percent: Optional[float] = None
+    _memory: Optional[Any] = None  # psutil.virtual_memory() snapshot
+
+    # Probes arrive far more often than the signals change: serve a recent result,
+    # and let concurrent misses share one in-flight check
+    CACHE_TTL = 3.0
+    _cached: Optional[Tuple[float, Dict[str, Any]]] = None
+    _inflight: Optional["asyncio.Task[Dict[str, Any]]"] = None
+
+    @classmethod
+    async def sample_system(cls, interval: float = CPU_SAMPLE_INTERVAL) -> None:
+        """Refresh the cached CPU and memory readings every interval seconds until cancelled."""
+        delay = min(interval, 1.0)  # first reading lands soon after startup
+        while True:
+            cls._memory = psutil.virtual_memory()
+            await asyncio.sleep(delay)
+            cls._cpu_percent = psutil.cpu_percent(interval=None)
+            delay = interval
+
+    @classmethod
+    def _read_cpu_percent(cls) -> float:
+        """The sampler's last CPU reading; sampled here only if there is none yet."""
+        if cls._cpu_percent is None:
+            cls._cpu_percent = psutil.cpu_percent(interval=None)
+        return cls._cpu_percent
 
     async def check(self) -> Dict[str, Any]:
         """
@@ -22,29 +59,62 @@ class HealthChecker:
         Returns:
             Dict[str, Any]: Detailed health status of each component
         """
+        cls = type(self)
+        cached = cls._cached
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+
+        task = cls._inflight
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = cls._inflight = asyncio.create_task(self._check_components())
+        # Shielded so one cancelled probe doesn't cancel the check others are waiting on
+        return await asyncio.shield(task)
+
+    async def _check_components(self) -> Dict[str, Any]:
         try:
-            system_health = self._check_system_health()
+            # Components are checked concurrently, each bounded by its own timeout,
+            # so the response takes as long as the slowest check rather than their sum
+            checks = {
+                "system": self._check_system(),
+                # Placeholder for future components
+                # "database": self._check_database(),
+                # "cache": self._check_cache(),
+                # "ai_service": self._check_ai_service(),
+            }
+            results = await asyncio.gather(
+                *(asyncio.wait_for(check, timeout=self.COMPONENT_TIMEOUT) for check in checks.values()),
+                return_exceptions=True
+            )
 
-            return {
+            status = {
                 "timestamp": datetime.utcnow().isoformat(),
                 "api": {
                     "status": "healthy",
                     "uptime": self._get_uptime()
                 },
-                "system": system_health,
-                # Placeholder for future components
-                # "database": await self._check_database(),
-                # "cache": await self._check_cache(),
-                # "ai_service": await self._check_ai_service(),
             }
+            for component, result in zip(checks, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Health check for {component} failed: {result!r}")
+                    result = {"status": "unhealthy", "error": str(result) or type(result).__name__}
+                status[component] = result
+            type(self)._cached = (time.monotonic(), status)
+            return status
         except Exception as e:
             logger.error(f"Health check failed: {str(e)}")
+            cached = type(self)._cached
+            if cached is not None:
+                # Serve the last good result rather than failing the probe outright
+                return cached[1]
             return {
                 "timestamp": datetime.utcnow().isoformat(),
                 "status": "unhealthy",
                 "error": str(e)
             }
 
+    async def _check_system(self) -> Dict[str, Any]:
+        return self._check_system_health()
+
     def _check_system_health(self) -> Dict[str, Any]:
         """
         Check system resources (CPU, memory).
@@ -53,12 +123,12 @@ class HealthChecker:
             Dict[str, Any]: Detailed system health metrics
         """
         try:
-            # Get CPU usage
-            cpu_usage = psutil.cpu_percent(interval=1)
+            # Get CPU usage from the background sampler
+            cpu_usage = self._read_cpu_percent()
             cpu_healthy = cpu_usage <= self.CPU_THRESHOLD
 
-            # Get memory usage
-            memory = psutil.virtual_memory()
+            # Get memory usage: the background sample when the sampler is running
+            memory = self._memory or psutil.virtual_memory()
             memory_healthy = memory.percent <= self.MEMORY_THRESHOLD
 
             # Log warnings if thresholds are exceeded
@@ -1,13 +1,20 @@
 # app/services/operator_runner.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Tuple, AsyncIterator, Union
+from dataclasses import dataclass, replace
 from datetime import datetime
 import json
+import orjson
 import uuid
 import os
+import re
+import logging
+import time
+import random
 import asyncio
+from functools import lru_cache
+from itertools import chain, repeat
 from app.infrastructure.html_summarizer import HTMLSummarizer
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError  # Add PlaywrightError
 
@@ -20,11 +27,14 @@ from app.infrastructure.playwright_manager import (
 from app.infrastructure.ai_generators import (
     create_nl_to_gherkin_generator,
     create_playwright_generator,
+    NLToGherkinGenerator,
+    PlaywrightGenerator,
     GherkinStep
 )
 from app.infrastructure.interfaces import HTMLSummarizerInterface
 from app.infrastructure.snapshot_storage import SnapshotStorage, SnapshotHTMLStorage
 from app.utils.logger import get_logger
+from app.utils.config import get_settings
 from dotenv import load_dotenv
 from app.domain.exceptions import (
     OperatorExecutionException,
@@ -36,7 +46,46 @@ from app.domain.exceptions import (
 logger = get_logger(__name__)
 load_dotenv()
 
-@dataclass
+# Snapshot encoding sent to the LLM: compact (indentation is pure token overhead, the nesting
+# already carries the structure) and UTF-8 rather than \u escapes
+_PROMPT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Generators are stateless apart from their AI client and response cache, so one per client
+# type is shared by every runner instead of being rebuilt for each request
+@lru_cache(maxsize=8)
+def _nl_to_gherkin_generator(ai_client_type: str) -> NLToGherkinGenerator:
+    return create_nl_to_gherkin_generator(ai_client_type)
+
+@lru_cache(maxsize=8)
+def _playwright_generator(ai_client_type: str) -> PlaywrightGenerator:
+    return create_playwright_generator(ai_client_type, cache_path=get_settings().response_cache_path)
+
+# Steps that only read the page: the next step sees the same DOM, so its instruction can be
+# generated while this one executes
+_NON_MUTATING_ACTIONS = frozenset({"verify", "assert", "read"})
+
+# Gherkin targets that already are an id/class/attribute selector or an absolute URL;
+# quotes are excluded so they can be embedded in an instruction as-is
+_SELECTOR_TARGET_RE = re.compile(r"[#.][A-Za-z][\w-]*|[a-z]+\[[\w-]+=[\w-]+\]")
+_URL_TARGET_RE = re.compile(r"https?://[^\s'\"\\]+")
+_QUOTE_CHARS = frozenset("'\"\\")
+
+def _deterministic_instruction(gherkin_step: GherkinStep) -> Optional[Dict[str, List[str]]]:
+    """Instructions for a step whose target needs no interpretation, or None to ask the LLM."""
+    target = gherkin_step.target.strip()
+    if gherkin_step.action == "navigate" and _URL_TARGET_RE.fullmatch(target):
+        instruction = f"goto('{target}')"
+    elif not _SELECTOR_TARGET_RE.fullmatch(target):
+        return None
+    elif gherkin_step.action == "click":
+        instruction = f"click('{target}')"
+    elif gherkin_step.action == "input" and gherkin_step.value and _QUOTE_CHARS.isdisjoint(gherkin_step.value):
+        instruction = f"fill('{target}', '{gherkin_step.value}')"
+    else:
+        return None
+    return {"high_precision": [instruction], "low_precision": []}
+
+@dataclass(slots=True)
 class StepExecutionResult:
     natural_language_step: str
     gherkin_step: GherkinStep
@@ -47,7 +96,7 @@ class StepExecutionResult:
     end_time: datetime
     duration: float
 
-@dataclass
+@dataclass(slots=True)
 class OperatorCaseResult:
     success: bool
     steps_results: List[StepExecutionResult]
@@ -67,7 +116,22 @@ class OperatorRunnerInterface(ABC):
     ) -> OperatorCaseResult:
         pass
 
+    async def stream_operator_case(
+        self,
+        url: str,
+        natural_language_steps: str,
+        headless: Optional[bool] = None
+    ) -> AsyncIterator[Union[StepExecutionResult, OperatorCaseResult]]:
+        """Yield each step result as it completes, then the case result with empty steps_results."""
+        result = await self.run_operator_case(url, natural_language_steps, headless)
+        for step_result in result.steps_results:
+            yield step_result
+        yield replace(result, steps_results=[])
+
 class OperatorRunnerService(OperatorRunnerInterface):
+    # Seconds cleanup waits for queued snapshot writes before giving up on them
+    SNAPSHOT_DRAIN_TIMEOUT = 5.0
+
     def __init__(
         self,
         browser_config: Optional[BrowserConfig] = None,
@@ -77,36 +141,36 @@ class OperatorRunnerService(OperatorRunnerInterface):
         snapshot_html_storage: Optional[SnapshotHTMLStorage] = None,
     ):
         self.browser_config = browser_config or BrowserConfig()
-        self.nl_to_gherkin = create_nl_to_gherkin_generator(ai_client_type)
-        self.playwright_generator = create_playwright_generator(ai_client_type)
+        self.nl_to_gherkin = _nl_to_gherkin_generator(ai_client_type)
+        self.playwright_generator = _playwright_generator(ai_client_type)
         self.html_summarizer = html_summarizer or HTMLSummarizer()
         self.snapshot_storage = snapshot_storage or SnapshotStorage()
         self.snapshot_html_storage = snapshot_html_storage or SnapshotHTMLStorage()
         self._browser_manager: Optional[BrowserManagerInterface] = None
         self._browser_initialized = False
+        # (page fingerprint, html, summarized snapshot) from the last step
+        self._snapshot_cache: Optional[Tuple[Any, str, Dict[str, Any]]] = None
+        # (next step, page fingerprint, instruction task) started while a read-only step executes
+        self._prefetch: Optional[Tuple[GherkinStep, Any, asyncio.Task]] = None
+        # Training-data snapshots are written by a background task, in step order
+        self._snapshot_queue: Optional[asyncio.Queue] = None
+        self._snapshot_writer: Optional[asyncio.Task] = None
 
     async def _initialize_browser(self, headless: Optional[bool] = None) -> None:
         if not self._browser_initialized:
             try:
                 effective_config = self.browser_config
                 if headless is not None:
-                    effective_config = BrowserConfig(
-                        headless=headless,
-                        viewport_width=self.browser_config.viewport_width,
-                        viewport_height=self.browser_config.viewport_height,
-                        timeout=self.browser_config.timeout,
-                        screenshot_dir=self.browser_config.screenshot_dir,
-                        trace_dir=self.browser_config.trace_dir
-                    )
+                    effective_config = replace(self.browser_config, headless=headless)
                 logger.debug("Creating browser manager")
                 self._browser_manager = create_browser_manager(config=effective_config)
                 logger.debug("Starting browser")
                 await self._browser_manager.start()
                 self._browser_initialized = True
-                logger.info(f"Browser initialized in {'headless' if effective_config.headless else 'headed'} mode")
+                logger.info("Browser initialized in %s mode", 'headless' if effective_config.headless else 'headed')
             except Exception as e:
                 self._browser_initialized = False
-                logger.error(f"Browser initialization failed: {str(e)}")
+                logger.error("Browser initialization failed: %s", e)
                 raise OperatorExecutionException(f"Failed to initialize browser: {str(e)}")
 
     async def _cleanup_browser(self) -> None:
@@ -115,11 +179,14 @@ class OperatorRunnerService(OperatorRunnerInterface):
                 logger.debug("Stopping browser")
                 await self._browser_manager.stop()
             except Exception as e:
-                logger.error(f"Browser cleanup failed: {str(e)}")
+                logger.error("Browser cleanup failed: %s", e)
             finally:
                 self._browser_manager = None
                 self._browser_initialized = False
+                self._snapshot_cache = None
+                self._discard_prefetch()
                 logger.debug("Browser cleanup completed")
+        await self._drain_snapshots()
 
     async def _ensure_browser_ready(self, headless: Optional[bool] = None) -> None:
         if not self._browser_initialized or self._browser_manager is None:
@@ -127,12 +194,34 @@ class OperatorRunnerService(OperatorRunnerInterface):
             
     async def _get_fallback_locator_instruction(self, instruction: str, error_message: str, gherkin_step: GherkinStep) -> Optional[str]:
         """Generate a fallback instruction for strict mode violations."""
-        logger.debug(f"Generating fallback for instruction: {instruction} to: {instruction.replace('.click()', '.nth(0).click()')}")
-        return instruction.replace(".click()", ".nth(0).click()")
+        fallback_instruction = instruction.replace(".click()", ".nth(0).click()")
+        logger.debug("Generating fallback for instruction: %s to: %s", instruction, fallback_instruction)
+        return fallback_instruction
     
     async def run_operator_case(self, url: str, natural_language_steps: str, headless: Optional[bool] = None) -> OperatorCaseResult:
-        start_time = datetime.now()
         steps_results = []
+        async for item in self.stream_operator_case(url, natural_language_steps, headless):
+            if isinstance(item, OperatorCaseResult):
+                item.steps_results = steps_results
+                return item
+            steps_results.append(item)
+        raise OperatorExecutionException("Operator case ended without a result")
+
+    async def stream_operator_case(
+        self,
+        url: str,
+        natural_language_steps: str,
+        headless: Optional[bool] = None
+    ) -> AsyncIterator[Union[StepExecutionResult, OperatorCaseResult]]:
+        """
+        Run a case, yielding each step result as soon as it completes.
+
+        The last item is the OperatorCaseResult; its steps_results is empty since the steps
+        were already yielded, so nothing holds on to every step for the length of the case.
+        Closing the generator early stops the case and releases the browser.
+        """
+        start_time = datetime.now()
+        started = time.monotonic()  # durations come from the monotonic clock, immune to wall-clock steps
         success = True
         error_message = None
         metadata = {"request_id": str(uuid.uuid4())}
@@ -140,42 +229,42 @@ class OperatorRunnerService(OperatorRunnerInterface):
         try:
             logger.info("--------------------------------------Started running Operator------------------------------")
             logger.info("Generating structured Gherkin steps from natural language")
+            # The browser starts while the LLM generates the steps; neither needs the other
+            browser_ready = asyncio.create_task(self._ensure_browser_ready(headless=headless))
             try:
                 gherkin_steps = await self.nl_to_gherkin.generate_steps(natural_language_steps)
                 if not gherkin_steps:
                     raise ValidationException("No steps were generated from the natural language input")
             except Exception as e:
+                # Let the browser finish starting so cleanup releases it rather than a half-launched one
+                await asyncio.gather(browser_ready, return_exceptions=True)
                 raise StepGenerationException(f"Step generation failed: {str(e)}")
 
-            await self._ensure_browser_ready(headless=headless)
+            await browser_ready
 
-            logger.info(f"Navigating to URL: {url}")
+            logger.info("Navigating to URL: %s", url)
             max_retries = 3
             navigation_success = False
 
             for attempt in range(max_retries):
                 try:
-                    logger.debug(f"Navigation attempt {attempt + 1}/{max_retries}")
-                    nav_result = await self._browser_manager.execute_step(
-                        f"goto('{url}', {{ wait_until: 'load', timeout: {self.browser_config.timeout} }})"
-                    )
-                    await self._browser_manager.execute_step(
-                        f"page.wait_for_load_state('networkidle', timeout={self.browser_config.timeout})"
-                    )
+                    logger.debug("Navigation attempt %s/%s", attempt + 1, max_retries)
+                    nav_result = await self._browser_manager.navigate(url, timeout=self.browser_config.timeout)
                     if not nav_result.success:
-                        logger.warning(f"Navigation command failed: {nav_result.error_message}")
+                        logger.warning("Navigation command failed: %s", nav_result.error_message)
                         raise OperatorExecutionException("Navigation command failed")
                     try:
                         navigation_success = True
-                        logger.info(f"Successfully navigated to {url}")
+                        logger.info("Successfully navigated to %s", url)
                         break
                     except PlaywrightTimeoutError as wait_error:
-                        logger.warning(f"Page readiness check failed: {str(wait_error)}")
+                        logger.warning("Page readiness check failed: %s", wait_error)
                         continue
                 except Exception as e:
-                    logger.warning(f"Navigation attempt {attempt + 1} failed: {str(e)}")
+                    logger.warning("Navigation attempt %s failed: %s", attempt + 1, e)
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(2)
+                        # Exponential backoff with jitter: transient failures recover in ~100ms
+                        await asyncio.sleep(min(0.1 * (2 ** attempt), 2.0) + random.uniform(0, 0.05))
                     continue
 
             if not navigation_success:
@@ -183,19 +272,27 @@ class OperatorRunnerService(OperatorRunnerInterface):
                     f"Failed to navigate to {url} after {max_retries} attempts"
                 )
 
-            nl_steps_list = [s.strip() for s in natural_language_steps.split('\n') if s.strip()]
-            for idx, step in enumerate(gherkin_steps):
-                logger.info(f"--------------------------------------Gherkin Step #{idx}---------------------------------")
-                logger.info(f"Executing step {idx + 1}/{len(gherkin_steps)}: {step.gherkin}")
-                if idx == 0 and step.action == "navigate" and "am on" in step.gherkin.lower():
+            # Natural-language lines pair with Gherkin steps in order; extra Gherkin steps get ""
+            nl_steps = chain(
+                (stripped for s in natural_language_steps.split('\n') if (stripped := s.strip())),
+                repeat("")
+            )
+            first_step = gherkin_steps[0]
+            skip_first_step = first_step.action == "navigate" and "am on" in first_step.gherkin.lower()
+            total_steps = len(gherkin_steps)
+            for idx, (step, nl_step) in enumerate(zip(gherkin_steps, nl_steps)):
+                logger.info("--------------------------------------Gherkin Step #%s---------------------------------", idx)
+                logger.info("Executing step %s/%s: %s", idx + 1, total_steps, step.gherkin)
+                if idx == 0 and skip_first_step:
                     logger.debug("Skipping first navigation step as it's asserting initial state")
                     continue
                 try:
                     step_result = await self._execute_single_step(
-                        natural_language_step=nl_steps_list[idx] if idx < len(nl_steps_list) else "",
-                        gherkin_step=step
+                        natural_language_step=nl_step,
+                        gherkin_step=step,
+                        next_step=gherkin_steps[idx + 1] if idx + 1 < total_steps else None
                     )
-                    steps_results.append(step_result)
+                    yield step_result
 
                     if not step_result.execution_result.success:
                         success = False
@@ -217,16 +314,16 @@ class OperatorRunnerService(OperatorRunnerInterface):
         except Exception as e:
             success = False
             error_message = f"Unexpected error: {str(e)}"
-            logger.error(f"Test case execution failed: {error_message}", exc_info=True)
+            logger.error("Test case execution failed: %s", error_message, exc_info=True)
         finally:
             await self._cleanup_browser()
 
         end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.monotonic() - started
 
-        return OperatorCaseResult(
+        yield OperatorCaseResult(
             success=success,
-            steps_results=steps_results,
+            steps_results=[],
             start_time=start_time,
             end_time=end_time,
             total_duration=duration,
@@ -236,105 +333,213 @@ class OperatorRunnerService(OperatorRunnerInterface):
 
     async def _wait_for_page_ready(self) -> None:
         try:
+            # 'load' fires after DOMContentLoaded, so one wait covers both
             await self._browser_manager.execute_step(
-                f"wait_for_load_state('load', timeout={self.browser_config.timeout})"
-            )
-            await self._browser_manager.execute_step(
-                f"wait_for_load_state('domcontentloaded', timeout={self.browser_config.timeout})"
+                f"wait_for_load_state('load', timeout={self.browser_config.timeout})",
+                capture_screenshot=False
             )
         except PlaywrightTimeoutError as e:
-            logger.warning(f"Page ready wait failed: {str(e)}")
+            logger.warning("Page ready wait failed: %s", e)
             raise
 
+    async def _save_snapshots(self, snapshot_json: Dict[str, Any], snapshot_html: str) -> None:
+        try:
+            # Write both snapshots off the event loop so other requests keep running
+            await asyncio.gather(
+                asyncio.to_thread(self.snapshot_storage.save_snapshot, snapshot_json),
+                asyncio.to_thread(self.snapshot_html_storage.save_snapshot, snapshot_html)
+            )
+            logger.debug("Training data saved via SnapshotStorage")
+        except IOError as e:
+            logger.warning("Failed to save snapshot: %s", e)
+
+    def _queue_snapshots(self, snapshot_json: Dict[str, Any], snapshot_html: str) -> None:
+        if self._snapshot_writer is None or self._snapshot_writer.done():
+            self._snapshot_queue = asyncio.Queue()
+            self._snapshot_writer = asyncio.create_task(self._write_snapshots(self._snapshot_queue))
+        self._snapshot_queue.put_nowait((snapshot_json, snapshot_html))
+
+    async def _write_snapshots(self, queue: asyncio.Queue) -> None:
+        while True:
+            snapshot_json, snapshot_html = await queue.get()
+            try:
+                await self._save_snapshots(snapshot_json, snapshot_html)
+            except Exception as e:
+                logger.warning("Snapshot writer failed: %s", e)
+            finally:
+                queue.task_done()
+
+    async def _drain_snapshots(self) -> None:
+        """Wait, up to SNAPSHOT_DRAIN_TIMEOUT, for queued snapshots to be written, then stop the writer."""
+        writer, queue = self._snapshot_writer, self._snapshot_queue
+        if writer is None:
+            return
+        self._snapshot_writer = self._snapshot_queue = None
+        try:
+            await asyncio.wait_for(queue.join(), timeout=self.SNAPSHOT_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %s unwritten snapshots", queue.qsize())
+        finally:
+            writer.cancel()
+
+    def _discard_prefetch(self) -> None:
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            prefetch[2].cancel()
+
+    async def _take_prefetched_instruction(self, gherkin_step: GherkinStep, fingerprint: Any) -> Optional[str]:
+        """Instruction prefetched for this step, or None if there is none or the DOM changed since."""
+        prefetch = self._prefetch
+        if prefetch is None:
+            return None
+        if prefetch[0] is not gherkin_step or prefetch[1] != fingerprint:
+            logger.debug("Page changed since the instruction was prefetched, regenerating")
+            self._discard_prefetch()
+            return None
+        self._prefetch = None
+        try:
+            return await prefetch[2]
+        except Exception as e:
+            logger.warning("Prefetched instruction failed, regenerating: %s", e)
+            return None
+
+    def _prefetch_instruction(self, prompt_snapshot: str, next_step: GherkinStep, fingerprint: Any) -> None:
+        task = asyncio.create_task(
+            self.playwright_generator.generate_instruction(prompt_snapshot, next_step.gherkin)
+        )
+        # Failures are retried serially when the step is reached; don't log them as unretrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._prefetch = (next_step, fingerprint, task)
+
+    async def _execute_instruction_candidates(
+        self,
+        instruction_data: Dict[str, Any],
+        gherkin_step: GherkinStep
+    ) -> Tuple[Optional[str], Optional[ExecutionResult], Optional[str]]:
+        """Run the generated instructions in precision order; returns (executed instruction, last result, last error)."""
+        executed_instruction = None
+        execution_result = None
+        last_error = None
+        # One pass over both lists; low precision instructions are only a fallback
+        # for when no high precision instruction succeeded
+        candidates = chain(
+            zip(repeat("high"), instruction_data.get("high_precision", ())),
+            zip(repeat("low"), instruction_data.get("low_precision", ()))
+        )
+        executed_precision = None
+        for precision, instruction in candidates:
+            if precision == "low" and executed_precision == "high":
+                break
+            logger.debug("Trying %s precision instruction > %s", precision, instruction)
+            execution_result = await self._browser_manager.execute_step(instruction)
+            if not execution_result.success:
+                logger.debug("%s precision instruction failed: %s", precision.capitalize(), execution_result.error_message)
+                if "strict mode violation" in execution_result.error_message.lower():
+                    logger.warning("Strict mode violation for instruction: %s", instruction)
+                    fallback_instruction = await self._get_fallback_locator_instruction(instruction, execution_result.error_message, gherkin_step)
+                    if fallback_instruction:
+                        logger.debug("Trying fallback instruction: %s", fallback_instruction)
+                        execution_result = await self._browser_manager.execute_step(fallback_instruction)
+                        if execution_result.success:
+                            executed_instruction, executed_precision = fallback_instruction, precision
+                            logger.debug("Successfully executed fallback instruction > %s", fallback_instruction)
+                            continue
+                        else:
+                            logger.debug("Fallback instruction failed: %s", execution_result.error_message)
+                            last_error = execution_result.error_message
+                    else:
+                        last_error = execution_result.error_message
+                else:
+                    last_error = execution_result.error_message
+                continue
+            executed_instruction, executed_precision = instruction, precision
+            logger.debug("Successfully executed instruction > %s", instruction)
+        return executed_instruction, execution_result, last_error
+
     async def _execute_single_step(
         self,
         natural_language_step: str,
-        gherkin_step: GherkinStep
+        gherkin_step: GherkinStep,
+        next_step: Optional[GherkinStep] = None
     ) -> StepExecutionResult:
         start_time = datetime.now()
+        started = time.monotonic()
         snapshot_json = None
         execution_result = None
         executed_instruction = None
 
         try:
-            snapshot_before = await self._browser_manager.get_page_content()
-            if not snapshot_before:
-                raise StepExecutionException("Empty page snapshot received")
-            snapshot_json = self.html_summarizer.summarize_html(snapshot_before)
-
+            fingerprint = await self._browser_manager.page_fingerprint()
+            cached = self._snapshot_cache
+            if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+                # No navigation or DOM mutation since the last step: reuse its snapshot
+                logger.debug("DOM unchanged since last step, reusing snapshot")
+                snapshot_before, snapshot_json = cached[1], cached[2]
+            else:
+                snapshot_before = await self._browser_manager.get_page_content()
+                if not snapshot_before:
+                    raise StepExecutionException("Empty page snapshot received")
+                if cached is not None and cached[1] == snapshot_before:
+                    # Mutations (or an unknown fingerprint) but byte-identical HTML: skip the re-parse
+                    logger.debug("Page HTML unchanged since last step, reusing snapshot")
+                    snapshot_json = cached[2]
+                else:
+                    snapshot_json = self.html_summarizer.summarize_html(snapshot_before)
+                    # Training data only: written in the background, off the step's critical path
+                    self._queue_snapshots(snapshot_json, snapshot_before)
+                self._snapshot_cache = (fingerprint, snapshot_before, snapshot_json)
+
+            prompt_snapshot = orjson.dumps(snapshot_json, option=_PROMPT_JSON_OPTIONS).decode()
+            # Steps that already name a selector or URL skip the LLM round trip
+            deterministic_data = _deterministic_instruction(gherkin_step)
             try:
-                self.snapshot_storage.save_snapshot(snapshot_json)
-                self.snapshot_html_storage.save_snapshot(snapshot_before)
-                logger.debug("Training data saved via SnapshotStorage")
-            except IOError as e:
-                logger.warning(f"Failed to save snapshot: {str(e)}")
+                if deterministic_data is not None:
+                    logger.debug("Using deterministic instruction for step: %s", gherkin_step.gherkin)
+                    instruction_json = None
+                else:
+                    instruction_json = await self._take_prefetched_instruction(gherkin_step, fingerprint)
+                    if instruction_json is None:
+                        instruction_json = await self.playwright_generator.generate_instruction(
+                            prompt_snapshot,
+                            gherkin_step.gherkin
+                        )
 
-            try:
-                instruction_json = await self.playwright_generator.generate_instruction(
-                    json.dumps(snapshot_json, indent=2),
-                    gherkin_step.gherkin
-                )
+                # This step leaves the DOM as it is, so the next step's instruction is generated
+                # from the same snapshot while this one executes; the fingerprint check above
+                # discards it if the page changed after all
+                if (
+                    next_step is not None
+                    and fingerprint is not None
+                    and gherkin_step.action in _NON_MUTATING_ACTIONS
+                    and _deterministic_instruction(next_step) is None
+                ):
+                    self._prefetch_instruction(prompt_snapshot, next_step, fingerprint)
 
                 try:
-                    instruction_data = json.loads(instruction_json)
-                    last_error = None
-                    logger.debug(f"Instruction Data >> {instruction_data}")
-                    for instruction in instruction_data.get("high_precision", []):
-                        logger.debug(f"Trying high precision instruction > {instruction}")
-                        execution_result = await self._browser_manager.execute_step(instruction)
-                        if not execution_result.success:
-                            logger.debug(f"High precision instruction failed: {execution_result.error_message}")
-                            if "strict mode violation" in execution_result.error_message.lower():
-                                logger.warning(f"Strict mode violation for instruction: {instruction}")
-                                fallback_instruction = await self._get_fallback_locator_instruction(instruction, execution_result.error_message, gherkin_step)
-                                if fallback_instruction:
-                                    logger.debug(f"Trying fallback instruction: {fallback_instruction}")
-                                    execution_result = await self._browser_manager.execute_step(fallback_instruction)
-                                    if execution_result.success:
-                                        executed_instruction = fallback_instruction
-                                        logger.debug(f"Successfully executed fallback instruction > {fallback_instruction}")
-                                        continue
-                                    else:
-                                        logger.debug(f"Fallback instruction failed: {execution_result.error_message}")
-                                        last_error = execution_result.error_message
-                                else:
-                                    last_error = execution_result.error_message
-                            else:
-                                last_error = execution_result.error_message
-                            continue
-                        executed_instruction = instruction
-                        logger.debug(f"Successfully executed instruction > {instruction}")
-                        continue
+                    instruction_data = deterministic_data or orjson.loads(instruction_json)
+                    logger.debug("Instruction Data >> %s", instruction_data)
+                    executed_instruction, execution_result, last_error = await self._execute_instruction_candidates(
+                        instruction_data, gherkin_step
+                    )
 
-                    if not executed_instruction:
-                        for instruction in instruction_data.get("low_precision", []):
-                            logger.debug(f"Trying low precision instruction > {instruction}")
-                            execution_result = await self._browser_manager.execute_step(instruction)
-                            if not execution_result.success:
-                                logger.debug(f"Low precision instruction failed: {execution_result.error_message}")
-                                if "strict mode violation" in execution_result.error_message.lower():
-                                    logger.warning(f"Strict mode violation for instruction: {instruction}")
-                                    fallback_instruction = await self._get_fallback_locator_instruction(instruction, execution_result.error_message, gherkin_step)
-                                    if fallback_instruction:
-                                        logger.debug(f"Trying fallback instruction: {fallback_instruction}")
-                                        execution_result = await self._browser_manager.execute_step(fallback_instruction)
-                                        if execution_result.success:
-                                            executed_instruction = fallback_instruction
-                                            logger.debug(f"Successfully executed fallback instruction > {fallback_instruction}")
-                                            continue
-                                        else:
-                                            logger.debug(f"Fallback instruction failed: {execution_result.error_message}")
-                                            last_error = execution_result.error_message
-                                    else:
-                                        last_error = execution_result.error_message
-                                else:
-                                    last_error = execution_result.error_message
-                                continue
-                            executed_instruction = instruction
-                            logger.debug(f"Successfully executed instruction > {instruction}")
-                            continue
+                    if not executed_instruction and deterministic_data is not None:
+                        # The step only looked like it named a selector (".NET", "#1"); ask the LLM
+                        logger.debug("Deterministic instruction failed, generating one for step: %s", gherkin_step.gherkin)
+                        deterministic_data = None
+                        instruction_json = await self.playwright_generator.generate_instruction(
+                            prompt_snapshot,
+                            gherkin_step.gherkin
+                        )
+                        instruction_data = orjson.loads(instruction_json)
+                        logger.debug("Instruction Data >> %s", instruction_data)
+                        executed_instruction, execution_result, last_error = await self._execute_instruction_candidates(
+                            instruction_data, gherkin_step
+                        )
 
                     if not executed_instruction:
+                        if deterministic_data is None:
+                            # Don't let a cached answer that failed here be served again next run
+                            await self.playwright_generator.invalidate_instruction(prompt_snapshot, gherkin_step.gherkin)
                         raise StepExecutionException(
                             f"No valid instructions executed. Last error: {last_error or 'Unknown error'}"
                         )
@@ -346,7 +551,7 @@ class OperatorRunnerService(OperatorRunnerInterface):
 
             except StepGenerationException as e:
                 end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
+                duration = time.monotonic() - started
                 execution_result = ExecutionResult(
                     success=False,
                     screenshot_path=None,
@@ -366,7 +571,7 @@ class OperatorRunnerService(OperatorRunnerInterface):
                 )
 
             end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.monotonic() - started
 
             return StepExecutionResult(
                 natural_language_step=natural_language_step,
@@ -380,9 +585,10 @@ class OperatorRunnerService(OperatorRunnerInterface):
             )
 
         except Exception as e:
-            logger.error(f"Step execution failed: {str(e)}", exc_info=True)
+            # Step failures are routine; the traceback is only worth formatting when debugging
+            logger.error("Step execution failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.monotonic() - started
             execution_result = ExecutionResult(
                 success=False,
                 screenshot_path=None,
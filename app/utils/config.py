@@ -1,9 +1,23 @@
 import os
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
 from pydantic import BaseModel, HttpUrl, Field, ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Chromium features a headless automation session doesn't need
+CHROMIUM_LAUNCH_ARGS: Tuple[str, ...] = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--no-first-run",
+    "--disable-blink-features=AutomationControlled",
+)
+
 class BrowserConfig(BaseModel):
     """Settings for the Playwright browser."""
     headless: bool = True
@@ -11,7 +25,14 @@ class BrowserConfig(BaseModel):
     viewport_height: int = 1080
     timeout: int = 5000  # milliseconds
     screenshot_dir: str = "screenshots"
+    screenshot_format: str = "jpeg"  # "jpeg" or "png"
+    screenshot_quality: int = 70  # jpeg only
+    screenshot_full_page: bool = False
+    wait_strategy: Literal["domcontentloaded", "load", "networkidle"] = "domcontentloaded"
     trace_dir: str = "traces"
+    pool_prewarm: int = 0  # browsers launched into the pool at API startup
+    launch_args: Tuple[str, ...] = CHROMIUM_LAUNCH_ARGS
+    chromium_sandbox: bool = False
 
 class AbacusConfig(BaseModel):
     """Abacus.AI specific configuration."""
@@ -38,11 +59,17 @@ class Settings(BaseSettings):
     items_per_user: int = 50
     base_url: HttpUrl = "http://localhost:8000"
     runner_type: str = "default"
+    behind_proxy: bool = False  # static files and screenshots are served by the reverse proxy
+    # Origins allowed to call the API cross-origin; the bundled pages are same-origin
+    cors_origins: List[str] = ["http://localhost:8000", "http://127.0.0.1:8000"]
     #valid_api_keys: List[str] = Field(default_factory=get_ia_api_key)
 
     # Browser configuration
     browser_config: BrowserConfig = BrowserConfig()
 
+    # SQLite file caching validated Playwright instructions across runs; unset disables it
+    response_cache_path: Optional[str] = None
+
     # Abacus.AI settings
     abacus_api_key: Optional[str] = None
     abacus_base_url: HttpUrl = "https://api.abacus.ai"
@@ -8,6 +8,9 @@ from datetime import datetime
 from app.infrastructure.ai_generators import (
     NLToGherkinGenerator,
     PlaywrightGenerator,
+    ResponseCache,
+    split_prompt,
+    cached_prompt_tokens,
     GherkinStep,
     StepGenerationException
 )
@@ -253,6 +256,63 @@ class TestPlaywrightGenerator:
         assert instruction_data["high_precision"][0] == "await expect(page.locator('h1')).toHaveText('Dashboard');"
         assert instruction_data["high_precision"][0].startswith("await expect")
 
+    @pytest.mark.asyncio
+    async def test_generate_instruction_cached(self, playwright_generator, mock_ai_client, tmp_path):
+        """Test that a repeated step against the same snapshot is served from the cache."""
+        playwright_generator.cache = ResponseCache(str(tmp_path / "llm.db"))
+        playwright_generator.prompt_template = "Test prompt: {web_page_snapshot} {gherkin_step}"
+        mock_ai_client.send_prompt.return_value = AIResponse(
+            content=VALID_PLAYWRIGHT_RESPONSE,
+            metadata={"foo": "bar"}
+        )
+
+        first = await playwright_generator.generate_instruction(
+            snapshot="<html>...</html>",
+            gherkin_step="When I click the login button"
+        )
+        second = await playwright_generator.generate_instruction(
+            snapshot="<html>...</html>",
+            gherkin_step="When I click the login button"
+        )
+        await playwright_generator.generate_instruction(
+            snapshot="<html>changed</html>",
+            gherkin_step="When I click the login button"
+        )
+
+        assert first == second
+        assert mock_ai_client.send_prompt.call_count == 2
+
+        await playwright_generator.invalidate_instruction(
+            snapshot="<html>...</html>",
+            gherkin_step="When I click the login button"
+        )
+        await playwright_generator.generate_instruction(
+            snapshot="<html>...</html>",
+            gherkin_step="When I click the login button"
+        )
+        assert mock_ai_client.send_prompt.call_count == 3
+
+    def test_split_prompt(self):
+        """Test that the static instructions are split from the per-call input section."""
+        static, dynamic = split_prompt("Rules\n\nINPUT:\n- step: {gherkin_step}\n")
+        assert static == "Rules"
+        assert dynamic == "INPUT:\n- step: {gherkin_step}\n"
+        assert split_prompt("Test prompt: {gherkin_step}") == ("", "Test prompt: {gherkin_step}")
+
+    def test_cached_prompt_tokens(self):
+        """Test reading prefix-cache hits from each provider's usage block."""
+        assert cached_prompt_tokens({"raw_response": {"usage": {"prompt_tokens_details": {"cached_tokens": 1024}}}}) == 1024
+        assert cached_prompt_tokens({"raw_response": {"usageMetadata": {"cachedContentTokenCount": 512}}}) == 512
+        assert cached_prompt_tokens({"foo": "bar"}) is None
+        assert cached_prompt_tokens(None) is None
+
+    def test_system_prompt_is_static(self, mock_ai_client):
+        """Test that the snapshot and step stay out of the system prompt."""
+        generator = PlaywrightGenerator(mock_ai_client)
+        assert generator.system_prompt
+        assert "{web_page_snapshot}" not in generator.system_prompt
+        assert "{web_page_snapshot}" in generator.prompt_template
+
 # Integration-style tests
 class TestGeneratorIntegration:
 
@@ -1,5 +1,6 @@
 # src/operateXRayTestCases/tests/test_html_parser.py
 import pytest
+import json
 from bs4 import BeautifulSoup, Comment, NavigableString
 from app.infrastructure.html_summarizer import HTMLSummarizer
 from pathlib import Path
@@ -255,4 +256,32 @@ def test_example_page(summarizer):
     button = div["children"][1]
     assert button["role"] == "button"
     assert button["name"] == "Login"
-    assert button["attributes"] == {"id": "login-button"}
\ No newline at end of file
+    assert button["attributes"] == {"id": "login-button"}
+
+def test_summarize_flat(summarizer):
+    """Test the flat structure-of-arrays output and its parent links."""
+    html = """
+    <html><head><title>Flat</title></head>
+    <body>
+        <div id="wrap">
+            <h2>Title</h2>
+            <a href="/x">Go</a>
+        </div>
+        <p>Tail</p>
+    </body></html>
+    """
+    flat = summarizer.summarize_flat(html)
+    assert flat["roles"] == ["WebArea", "generic", "heading", "link", "text"]
+    assert flat["names"][0] == "Flat"
+    assert flat["parent"] == [-1, 0, 1, 1, 0]
+    assert flat["attrs"][1] == {"id": "wrap"}
+    assert flat["attrs"][3] == {"href": "/x"}
+    assert flat["extra"][2] == {"level": 2}
+    assert summarizer._flat_to_nested(flat) == summarizer.summarize_html(html)
+
+
+def test_summarize_html_json(simple_html, summarizer):
+    """Test that the serialized output round-trips to the summarized DOM."""
+    data = summarizer.summarize_html_json(simple_html)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == summarizer.summarize_html(simple_html)
@@ -1,5 +1,6 @@
 # tests/unit/test_operator_runner.py
 import pytest
+import asyncio
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 import uuid
@@ -8,6 +9,7 @@ import json
 from app.services.operator_runner import (
     OperatorRunnerService,
     StepExecutionResult,
+    OperatorCaseResult,
     BrowserConfig
 )
 from app.infrastructure.ai_generators import GherkinStep
@@ -38,6 +40,12 @@ def mock_browser_manager():
         error_message=None
     ))
     manager.get_page_content = AsyncMock(return_value=SAMPLE_HTML)
+    manager.page_fingerprint = AsyncMock(return_value=None)
+    manager.navigate = AsyncMock(return_value=ExecutionResult(
+        success=True,
+        screenshot_path=MOCK_SCREENSHOT_PATH,
+        page_url=TEST_URL
+    ))
     return manager
 
 @pytest.fixture
@@ -70,6 +78,7 @@ def mock_playwright_generator():
         "high_precision": ["await page.click('#login-button');"],
         "low_precision": []
     }))
+    generator.invalidate_instruction = AsyncMock()
     return generator
 
 @pytest.fixture
@@ -114,8 +123,6 @@ class TestOperatorRunner:
     async def test_successful_operator_execution(self, test_runner, mock_browser_manager, mock_html_summarizer, mock_snapshot_storage):
         """Test successful execution of a test case."""
         mock_browser_manager.execute_step.side_effect = [
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # goto
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=TEST_URL),  # url
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # wait_for_load_state
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # wait_for_load_state
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=SAMPLE_HTML),  # get_page_content
@@ -145,9 +152,8 @@ class TestOperatorRunner:
     @pytest.mark.asyncio
     async def test_failed_operator_execution(self, test_runner, mock_browser_manager, mock_html_summarizer, mock_snapshot_storage):
         """Test handling of a failed step execution."""
+        mock_browser_manager.get_page_content.side_effect = [SAMPLE_HTML, SAMPLE_HTML.replace('</body>', '<p>Welcome</p></body>')]
         mock_browser_manager.execute_step.side_effect = [
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # goto
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=TEST_URL),  # url
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=TEST_URL),  # url
             ExecutionResult(
                 success=False,
@@ -184,9 +190,30 @@ class TestOperatorRunner:
         assert "Step generation error: Step generation failed: AI error" in result.error_message
         assert len(result.steps_results) == 0
         mock_step_generator.generate_steps.assert_called_once_with(TEST_NL_STEPS)
-        mock_browser_manager.start.assert_not_called()
+        # The browser starts concurrently with step generation and is released on failure
+        mock_browser_manager.start.assert_called_once()
         mock_browser_manager.stop.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_browser_starts_during_step_generation(self, test_runner, mock_browser_manager, mock_step_generator):
+        """Test that the browser starts while the Gherkin steps are still being generated."""
+        browser_started = asyncio.Event()
+        steps = mock_step_generator.generate_steps.return_value
+        mock_browser_manager.start.side_effect = browser_started.set
+
+        async def generate_steps(natural_language_steps):
+            # Would time out if the browser only started after generation
+            await asyncio.wait_for(browser_started.wait(), timeout=1)
+            return steps
+        mock_step_generator.generate_steps.side_effect = generate_steps
+
+        result = await test_runner.run_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )
+
+        assert result.success
+
     @pytest.mark.asyncio
     async def test_browser_initialization_failure(self, test_runner, mock_browser_manager):
         """Test handling of browser initialization failure."""
@@ -205,9 +232,8 @@ class TestOperatorRunner:
     @pytest.mark.asyncio
     async def test_step_execution_tracking(self, test_runner, mock_browser_manager, mock_html_summarizer, mock_snapshot_storage):
         """Test proper tracking of step execution results."""
+        mock_browser_manager.get_page_content.side_effect = [SAMPLE_HTML, SAMPLE_HTML.replace('</body>', '<p>Welcome</p></body>')]
         mock_browser_manager.execute_step.side_effect = [
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # goto
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=TEST_URL),  # url
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=SAMPLE_HTML),  # get_page_content
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # step 1
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=SAMPLE_HTML),  # get_page_content
@@ -232,10 +258,152 @@ class TestOperatorRunner:
         assert mock_html_summarizer.summarize_html.call_count == 2
         assert mock_snapshot_storage.save_snapshot.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_when_dom_unchanged(self, test_runner, mock_browser_manager, mock_html_summarizer, mock_snapshot_storage):
+        """Test that an unchanged page fingerprint skips re-reading and re-summarizing the page."""
+        mock_browser_manager.page_fingerprint.return_value = (TEST_URL, 1.0, 3)
+
+        result = await test_runner.run_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )
+
+        assert len(result.steps_results) == 2
+        assert result.steps_results[1].snapshot_json == SAMPLE_JSON
+        assert mock_browser_manager.get_page_content.call_count == 1
+        assert mock_html_summarizer.summarize_html.call_count == 1
+        assert mock_snapshot_storage.save_snapshot.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_html_parsed_once(self, test_runner, mock_browser_manager, mock_html_summarizer, mock_snapshot_storage):
+        """Test that byte-identical page HTML is not re-summarized even when the page cannot be fingerprinted."""
+        result = await test_runner.run_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )
+
+        assert len(result.steps_results) == 2
+        assert result.steps_results[1].snapshot_json == SAMPLE_JSON
+        assert mock_browser_manager.get_page_content.call_count == 2
+        assert mock_html_summarizer.summarize_html.call_count == 1
+        assert mock_snapshot_storage.save_snapshot.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_instruction_prefetched_after_read_only_step(self, test_runner, mock_browser_manager, mock_step_generator, mock_playwright_generator):
+        """Test that the step after a verify step has its instruction generated before the verify step executes."""
+        mock_browser_manager.page_fingerprint.return_value = (TEST_URL, 1.0, 3)
+        mock_step_generator.generate_steps.return_value = [
+            GherkinStep(gherkin="Then I should see the login form", action="verify", target="login form"),
+            GherkinStep(gherkin="And I click the login button", action="click", target="login button"),
+        ]
+        calls = []
+        mock_playwright_generator.generate_instruction.side_effect = lambda snapshot, step: calls.append(step) or json.dumps({
+            "high_precision": ["await page.click('#login-button');"],
+            "low_precision": []
+        })
+
+        async def execute_step(instruction, **kwargs):
+            await asyncio.sleep(0)  # a real browser round trip yields to the event loop
+            calls.append(instruction)
+            return ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, error_message=None)
+        mock_browser_manager.execute_step.side_effect = execute_step
+
+        result = await test_runner.run_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )
+
+        assert result.success
+        generated = [c for c in calls if c.endswith(("form", "button"))]
+        assert generated == ["Then I should see the login form", "And I click the login button"]
+        # The click step's instruction is requested before the verify step's instruction runs
+        assert calls.index("And I click the login button") < calls.index("await page.click('#login-button');")
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_steps_then_result(self, test_runner, mock_browser_manager):
+        """Test that streaming yields each step result as it completes, then the case result."""
+        items = [item async for item in test_runner.stream_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )]
+
+        assert [type(item) for item in items] == [StepExecutionResult, StepExecutionResult, OperatorCaseResult]
+        assert items[-1].success
+        assert items[-1].steps_results == []
+        mock_browser_manager.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_selector_target_skips_llm(self, test_runner, mock_browser_manager, mock_step_generator, mock_playwright_generator):
+        """Test that a step whose target is already a selector is executed without an LLM call."""
+        mock_step_generator.generate_steps.return_value = [
+            GherkinStep(gherkin="When I click '#login-button'", action="click", target="#login-button"),
+        ]
+
+        result = await test_runner.run_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )
+
+        assert result.success
+        assert result.steps_results[0].playwright_instruction == "click('#login-button')"
+        mock_playwright_generator.generate_instruction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_selector_target_falls_back_to_llm(self, test_runner, mock_browser_manager, mock_step_generator, mock_playwright_generator):
+        """Test that a target which only looks like a selector is resolved by the LLM once it fails."""
+        mock_step_generator.generate_steps.return_value = [
+            GherkinStep(gherkin="When I click '.NET'", action="click", target=".NET"),
+        ]
+        mock_playwright_generator.generate_instruction.return_value = json.dumps({
+            "high_precision": ["get_by_role('link', name='.NET').click()"],
+            "low_precision": []
+        })
+        mock_browser_manager.execute_step.side_effect = lambda instruction, **kwargs: ExecutionResult(
+            success=instruction != "click('.NET')",
+            screenshot_path=MOCK_SCREENSHOT_PATH,
+            error_message=None if instruction != "click('.NET')" else "Element not found"
+        )
+
+        result = await test_runner.run_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )
+
+        assert result.success
+        assert result.steps_results[0].playwright_instruction == "get_by_role('link', name='.NET').click()"
+        mock_playwright_generator.generate_instruction.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_low_precision_fallback(self, test_runner, mock_browser_manager, mock_step_generator, mock_playwright_generator):
+        """Test that low precision instructions run only when no high precision instruction succeeds."""
+        mock_step_generator.generate_steps.return_value = [
+            GherkinStep(gherkin="When I click the login button", action="click", target="login button"),
+            GherkinStep(gherkin="And I click the submit button", action="click", target="submit button"),
+        ]
+        mock_playwright_generator.generate_instruction.side_effect = [
+            json.dumps({"high_precision": ["click('#missing')"], "low_precision": ["click('#login')", "click('#unused')"]}),
+            json.dumps({"high_precision": ["click('#submit')"], "low_precision": ["click('#never')"]}),
+        ]
+        mock_browser_manager.execute_step.side_effect = lambda instruction, **kwargs: ExecutionResult(
+            success=instruction != "click('#missing')",
+            screenshot_path=MOCK_SCREENSHOT_PATH,
+            error_message=None if instruction != "click('#missing')" else "Element not found"
+        )
+
+        result = await test_runner.run_operator_case(
+            url=TEST_URL,
+            natural_language_steps=TEST_NL_STEPS
+        )
+
+        assert result.success
+        assert [r.playwright_instruction for r in result.steps_results] == ["click('#unused')", "click('#submit')"]
+        executed = [c.args[0] for c in mock_browser_manager.execute_step.call_args_list]
+        assert executed == ["click('#missing')", "click('#login')", "click('#unused')", "click('#submit')"]
+
     @pytest.mark.asyncio
     async def test_cleanup_on_failure(self, test_runner, mock_browser_manager):
         """Test browser cleanup on test failure."""
-        mock_browser_manager.execute_step.side_effect = Exception("Test error")
+        mock_browser_manager.navigate.side_effect = Exception("Test error")
 
         result = await test_runner.run_operator_case(
             url=TEST_URL,
@@ -263,8 +431,6 @@ class TestOperatorRunner:
     async def test_playwright_instruction_generation(self, test_runner, mock_browser_manager, mock_playwright_generator):
         """Test generation of Playwright instructions."""
         mock_browser_manager.execute_step.side_effect = [
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # goto
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=TEST_URL),  # url
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=SAMPLE_HTML),  # get_page_content (step 1)
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # step 1 action
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=SAMPLE_HTML),  # get_page_content (step 2)
@@ -297,19 +463,12 @@ class TestOperatorRunner:
     @pytest.mark.asyncio
     async def test_browser_navigation(self, test_runner, mock_browser_manager):
         """Test initial browser navigation."""
-        mock_browser_manager.execute_step.side_effect = [
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # goto
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=TEST_URL),  # url
-        ]
-
         await test_runner.run_operator_case(
             url=TEST_URL,
             natural_language_steps=TEST_NL_STEPS
         )
 
-        mock_browser_manager.execute_step.assert_any_call(
-            f"goto('{TEST_URL}', {{ wait_until: 'load', timeout: 30000 }})"
-        )
+        mock_browser_manager.navigate.assert_called_once_with(TEST_URL, timeout=test_runner.browser_config.timeout)
 
     @pytest.mark.asyncio
     async def test_empty_steps_handling(self, test_runner, mock_step_generator):
@@ -330,8 +489,6 @@ class TestOperatorRunner:
     async def test_screenshot_path_tracking(self, test_runner, mock_browser_manager):
         """Test proper tracking of screenshot paths."""
         mock_browser_manager.execute_step.side_effect = [
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # goto
-            ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=TEST_URL),  # url
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=SAMPLE_HTML),  # get_page_content (step 1)
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=None),  # step 1 action
             ExecutionResult(success=True, screenshot_path=MOCK_SCREENSHOT_PATH, result=SAMPLE_HTML),  # get_page_content (step 2)
@@ -1,5 +1,7 @@
 # tests/unit/test_playwright_manager.py
 
+import asyncio
+
 import pytest
 from app.infrastructure.playwright_manager import (
     create_browser_manager,
@@ -114,7 +116,257 @@ async def test_screenshot_functionality():
         
         assert result.success
         assert result.screenshot_path is not None
-        assert result.screenshot_path.endswith('.png')
+        assert result.screenshot_path.endswith('.jpeg')
         assert result.execution_time > 0
     finally:
-        await browser_manager.stop()
\ No newline at end of file
+        await browser_manager.stop()
+
+
+def test_instruction_allow_list(monkeypatch):
+    """Test allow-list validation dispatched on the instruction's call name."""
+    browser_manager = create_browser_manager()
+    monkeypatch.setattr(type(browser_manager), "ENFORCE_ALLOWED_ACTIONS", True)
+
+    assert browser_manager._is_instruction_allowed("goto('https://example.com')")
+    assert browser_manager._is_instruction_allowed("locator('#login').click()")
+    assert browser_manager._is_instruction_allowed("keyboard.press('Enter')")
+    assert browser_manager._is_instruction_allowed("url()")
+    assert not browser_manager._is_instruction_allowed("evaluate('document.cookie')")
+    assert not browser_manager._is_instruction_allowed("goto('file:///etc/passwd')")
+    assert browser_manager._is_instruction_allowed(
+        "locator('#list').filter({ hasText: 'Item' }).locator('input').fill('a', 'b')"
+    )
+    assert not browser_manager._is_instruction_allowed("locator('#list').locator('a').evaluate('x')")
+
+def test_parse_locator_chain():
+    """Test the single-pass locator chain parser."""
+    from app.infrastructure.playwright_manager import _parse_locator_chain
+
+    assert _parse_locator_chain("locator('#a').locator(\"b\").click()") == ("#a", "click", ())
+    assert _parse_locator_chain("locator('#a').filter({ hasText: 'x' }).press('Enter')") == ("#a", "press", ("Enter",))
+    assert _parse_locator_chain("locator('').click()") is None
+    assert _parse_locator_chain("locator('#a').filter({}).click()") is None
+    assert _parse_locator_chain("locator('#a').fill('x', )") is None
+    assert _parse_locator_chain("locator('#a" + ".locator('b')" * 5000) is None
+
+def test_instruction_plan():
+    """Test compiling instructions into call-chain handlers without eval."""
+    from app.infrastructure.playwright_manager import _parse_instruction, SecurityException
+
+    class FakeLocator:
+        def __init__(self, selector):
+            self.selector = selector
+
+        def nth(self, index):
+            return f"{self.selector}@{index}"
+
+    class FakePage:
+        url = "https://example.com"
+
+        def locator(self, selector):
+            return FakeLocator(selector)
+
+    page = FakePage()
+    parsed = _parse_instruction("page.locator('#item').nth(2);")
+    assert parsed.handler({"page": page}, page) == "#item@2"
+    assert not parsed.interactive
+    assert _parse_instruction("url").handler({}, page) == "https://example.com"
+    assert _parse_instruction("locator('#item').click()").interactive
+    assert not _parse_instruction("expect(locator('#item')).to_be_visible()").interactive
+    assert _parse_instruction("selectOption('#size', 'M')").interactive
+
+    with pytest.raises(SecurityException):
+        _parse_instruction("page.__class__")
+    with pytest.raises(SecurityException):
+        _parse_instruction("page.locator('a' + 'b')")
+    with pytest.raises(ValueError):
+        _parse_instruction("page.locator(")
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_share_browser(monkeypatch):
+    """Test that concurrent sessions share one launched browser and pool it once all release."""
+    from app.infrastructure.playwright_manager import PlaywrightManager
+
+    class FakeBrowser:
+        def is_connected(self):
+            return True
+
+    launched = []
+
+    async def fake_checkout(cls, config, loop):
+        launched.append(FakeBrowser())
+        return object(), launched[-1]
+
+    monkeypatch.setattr(PlaywrightManager, "_checkout_browser", classmethod(fake_checkout))
+    monkeypatch.setattr(PlaywrightManager, "_active_browsers", {})
+    monkeypatch.setattr(PlaywrightManager, "_browser_pool", {})
+    config = BrowserConfig()
+
+    first = await PlaywrightManager._acquire_browser(config)
+    second = await PlaywrightManager._acquire_browser(config)
+    assert first == second
+    assert len(launched) == 1
+
+    await PlaywrightManager._release_browser(config, *first)
+    assert PlaywrightManager._browser_pool == {}
+    await PlaywrightManager._release_browser(config, *second)
+    assert PlaywrightManager._active_browsers == {}
+    assert PlaywrightManager._browser_pool[PlaywrightManager._pool_key(config)].qsize() == 1
+
+@pytest.mark.asyncio
+async def test_parallel_sessions_launch_one_browser(monkeypatch):
+    """Test that sessions acquiring concurrently wait on a single launch."""
+    from app.infrastructure.playwright_manager import PlaywrightManager
+
+    class FakeBrowser:
+        def is_connected(self):
+            return True
+
+    launched = []
+
+    async def fake_checkout(cls, config, loop):
+        await asyncio.sleep(0)
+        launched.append(FakeBrowser())
+        return object(), launched[-1]
+
+    monkeypatch.setattr(PlaywrightManager, "_checkout_browser", classmethod(fake_checkout))
+    monkeypatch.setattr(PlaywrightManager, "_active_browsers", {})
+    monkeypatch.setattr(PlaywrightManager, "_pending_checkouts", {})
+    monkeypatch.setattr(PlaywrightManager, "_browser_pool", {})
+    config = BrowserConfig()
+
+    acquired = await asyncio.gather(*(PlaywrightManager._acquire_browser(config) for _ in range(3)))
+    assert len(launched) == 1
+    assert all(browser is launched[0] for _, browser in acquired)
+    assert PlaywrightManager._active_browsers[PlaywrightManager._pool_key(config)][3] == 3
+    assert PlaywrightManager._pending_checkouts == {}
+
+    _, sandboxed = await PlaywrightManager._acquire_browser(BrowserConfig(chromium_sandbox=True))
+    assert len(launched) == 2
+    assert sandboxed is launched[1]
+
+@pytest.mark.asyncio
+async def test_warm_pool_launches_distinct_browsers(monkeypatch):
+    """Test that warming the pool fills it with separate browsers."""
+    from app.infrastructure.playwright_manager import PlaywrightManager
+
+    class FakeBrowser:
+        def is_connected(self):
+            return True
+
+    async def fake_launch(config):
+        return object(), FakeBrowser()
+
+    monkeypatch.setattr(PlaywrightManager, "_launch_browser", staticmethod(fake_launch))
+    monkeypatch.setattr(PlaywrightManager, "_active_browsers", {})
+    monkeypatch.setattr(PlaywrightManager, "_browser_pool", {})
+    config = BrowserConfig()
+
+    await PlaywrightManager.warm_pool(config, size=PlaywrightManager.BROWSER_POOL_SIZE)
+    queue = PlaywrightManager._browser_pool[PlaywrightManager._pool_key(config)]
+    pooled = [queue.get_nowait()[2] for _ in range(queue.qsize())]
+    assert len(pooled) == PlaywrightManager.BROWSER_POOL_SIZE
+    assert len(set(map(id, pooled))) == PlaywrightManager.BROWSER_POOL_SIZE
+
+@pytest.mark.asyncio
+async def test_settle_fast_path_reprobes_networkidle():
+    """Test that a fast origin is re-measured periodically so its estimate can recover."""
+    from app.infrastructure.playwright_manager import PlaywrightManager, _SETTLE_REPROBE_EVERY
+
+    class FakePage:
+        url = "https://example.com/app"
+
+        def __init__(self):
+            self.states = []
+
+        async def wait_for_load_state(self, state):
+            self.states.append(state)
+            if state == "networkidle":
+                await asyncio.sleep(0.15)
+
+    manager = PlaywrightManager(BrowserConfig())
+    manager._page = FakePage()
+    manager._settle_ms_by_origin["example.com"] = 10.0
+
+    for _ in range(_SETTLE_REPROBE_EVERY):
+        await manager._wait_for_settle()
+    assert manager._page.states == ["domcontentloaded"] * (_SETTLE_REPROBE_EVERY - 1) + ["networkidle"]
+    assert manager._settle_ms_by_origin["example.com"] > 10.0
+
+@pytest.mark.asyncio
+async def test_screenshot_captured_before_step_returns(tmp_path):
+    """Test that the step's screenshot is taken before returning and only the write is deferred."""
+    from concurrent.futures import ThreadPoolExecutor
+    from app.infrastructure.playwright_manager import PlaywrightManager
+
+    class FakePage:
+        def __init__(self):
+            self.captures = 0
+
+        async def screenshot(self, **kwargs):
+            self.captures += 1
+            return b"image"
+
+    manager = PlaywrightManager(BrowserConfig(screenshot_dir=str(tmp_path)))
+    manager._page = FakePage()
+    manager._io_pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        path = await manager._schedule_screenshot()
+        assert manager._page.captures == 1
+        await manager.wait_for_screenshots()
+        assert open(path, "rb").read() == b"image"
+    finally:
+        manager._io_pool.shutdown(wait=True)
+
+@pytest.mark.asyncio
+async def test_goto_keyword_options():
+    """Test the prompt's goto form with Python keyword options, and that only http(s) URLs are loaded."""
+    from app.infrastructure.playwright_manager import PlaywrightManager
+
+    class FakePage:
+        url = "https://example.com/"
+
+        def __init__(self):
+            self.visits = []
+
+        async def goto(self, url, **kwargs):
+            self.visits.append((url, kwargs))
+
+    manager = PlaywrightManager(BrowserConfig())
+    manager._page = FakePage()
+    manager._handlers = {"page": manager._page, "goto": manager._page.goto}
+
+    result = await manager.execute_step(
+        "await page.goto('https://example.com/', wait_until='networkidle')", capture_screenshot=False
+    )
+    assert result.success
+    assert manager._page.visits == [("https://example.com/", {"wait_until": "networkidle"})]
+
+    manager._take_screenshot = lambda prefix: asyncio.sleep(0)
+    result = await manager.execute_step("goto('file:///etc/passwd', wait_until='load')", capture_screenshot=False)
+    assert not result.success
+    assert "Invalid goto instruction" in result.error_message
+    assert len(manager._page.visits) == 1
+
+@pytest.mark.asyncio
+async def test_goto_js_options_use_python_names():
+    """Test that camelCase options in goto('url', { ... }) reach page.goto as snake_case keywords."""
+    from app.infrastructure.playwright_manager import PlaywrightManager
+
+    class FakePage:
+        url = "https://example.com/"
+
+        def __init__(self):
+            self.visits = []
+
+        async def goto(self, url, **kwargs):
+            self.visits.append((url, kwargs))
+
+    manager = PlaywrightManager(BrowserConfig())
+    manager._page = FakePage()
+
+    result = await manager.execute_step(
+        "goto('https://example.com/', { waitUntil: 'load', timeout: 3000 })", capture_screenshot=False
+    )
+    assert result.success
+    assert manager._page.visits == [("https://example.com/", {"wait_until": "load", "timeout": 3000})]